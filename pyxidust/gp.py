@@ -3,6 +3,56 @@
 """Geoprocessing pipeline tools and workflow automation utilities."""
 ###############################################################################
 
+import os
+import sys
+import tempfile
+from itertools import repeat
+
+import arcpy
+from arcpy.analysis import Select, SplitByAttributes, Statistics
+from arcpy.cartography import ConvertLabelsToAnnotation
+from arcpy.conversion import RasterToPolygon, TableToTable
+from arcpy.da import FeatureClassToNumPyArray, InsertCursor
+from arcpy.da import NumPyArrayToTable, SearchCursor, TableToNumPyArray
+from arcpy.da import UpdateCursor, Walk
+from arcpy.ddd import CutFill
+from arcpy.management import AddField, CalculateField
+from arcpy.management import CalculateGeometryAttributes, CopyFeatures
+from arcpy.management import CreateFeatureclass, Delete, DeleteField
+from arcpy.management import GetCount, MakeXYEventLayer, Merge
+from arcpy.sa import ExtractByAttributes, ExtractByMask
+from arcpy.sa import IsoClusterUnsupervisedClassification
+from pyxidust.utils import extension, get_suffix, process_pool, suffix_list
+
+###############################################################################
+
+# (capability, line, property) per print_layers report section, in report
+# order; a None capability marks a boolean flag printed only when True
+_LAYER_PROPS = (
+    (('NAME', 'Layer name: {}', 'name'),
+        ('LONGNAME', 'Group name: {}', 'longName'),
+        (None, '3D layer = True', 'is3DLayer'),
+        (None, 'Web layer = True', 'isWebLayer'),
+        (None, 'Scene layer = True', 'isSceneLayer'),
+        (None, 'Time enabled = True', 'isTimeEnabled'),
+        (None, 'Raster layer = True', 'isRasterLayer'),
+        (None, 'Feature layer = True', 'isFeatureLayer'),
+        ('VISIBLE', 'Visible = {}', 'visible'),
+        (None, 'Network analyst layer = True', 'isNetworkAnalystLayer'),
+        (None, 'Network dataset layer = True', 'isNetworkDatasetLayer'),
+        ('SHOWLABELS', 'Labels on = {}', 'showLabels')),
+    (('TIME', 'Time: {}', 'time'), ('CONTRAST', 'Contrast: {}', 'contrast'),
+        ('BRIGHTNESS', 'Brightness: {}', 'brightness'),
+        ('TRANSPARENCY', 'Transparency: {}', 'transparency'),
+        ('MINTHRESHOLD', 'Min display scale: {}', 'minThreshold'),
+        ('MAXTHRESHOLD', 'Max display scale: {}', 'maxThreshold'),
+        ('DEFINITIONQUERY', 'Query: {}', 'definitionQuery')),
+    (('URI', 'Universal resource indicator: {}', 'URI'),
+        ('DATASOURCE', 'Source: {}', 'dataSource'),
+        ('CONNECTIONPROPERTIES', 'Connection: {}', 'connectionProperties')))
+
+###############################################################################
+
 def add_data(project, map_name, option, layers=None, layer_index=None,
     gdb=None):
     """Adds data to a map in an ArcGIS PRO project.
@@ -58,9 +108,6 @@ def add_data(project, map_name, option, layers=None, layer_index=None,
         layer_index=0)
     """
 
-    import os
-    import arcpy
-
     map_ = project.listMaps(map_name)[0]
 
     def _set_environment():
@@ -69,24 +116,21 @@ def add_data(project, map_name, option, layers=None, layer_index=None,
         arcpy.env.workspace = os.getcwd()
         arcpy.env.addOutputsToMap = True
 
-    def _move_layer():
-        new_layer = map_.listLayers()[0]
-        ref_layer = map_.listLayers()[layer_index]
-        map_.moveLayer(reference_layer=ref_layer, move_layer=new_layer,
-            insert_position='BEFORE')
-
     if option == 1:
-        map_.addDataFromPath(layers)
+        new_layer = map_.addDataFromPath(layers)
         if layer_index != 0:
-            _move_layer()
+            # index counted after the add, as the old add-then-move did
+            ref_layer = map_.listLayers()[layer_index]
+            map_.moveLayer(reference_layer=ref_layer, move_layer=new_layer,
+                insert_position='BEFORE')
 
     if option == 2:
         for layer in layers:
             map_.addDataFromPath(rf'{gdb}\\{layer}')
 
     if option == 3:
-        _set_environment()
-        for fc in arcpy.ListFeatureClasses():
+        # root-level feature classes; leaves arcpy.env untouched
+        for fc in next(Walk(gdb, datatype='FeatureClass'))[2]:
             map_.addDataFromPath(rf'{gdb}\\{fc}')
 
     if option == 4:
@@ -139,8 +183,6 @@ def change_source(project, dataset, layer, option, old_source, new_source):
         option=1, old_source=r'\\.gdb', new_source=r'\\.gdb')
     """
 
-    import arcpy
-
     if option == 1:
         source = {'dataset': dataset, 'workspace_factory': 'File Geodatabase',
                   'connection_info': {'database': old_source}}
@@ -166,29 +208,18 @@ def clear_gdb(gdb):
     clear_gdb(gdb=r'\\.gdb')
     """
 
-    import arcpy
-    from arcpy.management import Delete
-
-    arcpy.env.workspace = gdb
+    contents = []
 
-    features = arcpy.ListFeatureClasses()
-    rasters = arcpy.ListRasters()
-    tables = arcpy.ListTables()
+    # one catalog traversal for every data type
+    for dirpath, dirnames, filenames in Walk(gdb,
+        datatype=['FeatureClass', 'RasterDataset', 'Table']):
+        contents.extend(os.path.join(dirpath, name) for name in filenames)
 
-    try:
-        Delete(in_data=features)
-    except Exception as error:
-        print(error)
-
-    try:
-        Delete(in_data=rasters)
-    except Exception as error:
-        print(error)
-
-    try:
-        Delete(in_data=tables)
-    except Exception as error:
-        print(error)
+    if contents:
+        try:
+            Delete(in_data=contents)
+        except Exception as error:
+            print(error)
 
 ###############################################################################
 
@@ -214,17 +245,27 @@ def csv_to_features(input_file, output_features, projection, event_data):
         projection=r'\\.prj', event_data=r'\\event_1')
     """
 
-    import arcpy
-    from arcpy.management import CopyFeatures, DeleteIdentical
-    from arcpy.management import MakeXYEventLayer
+    # pandas stays lazy so the module imports without it
+    from pandas import read_csv
 
-    MakeXYEventLayer(table=input_file, in_x_field='x', in_y_field='y',
-        out_layer=event_data, spatial_reference=projection)
-    plot_csv_features = CopyFeatures(in_features=event_data,
-        out_feature_class=output_features)
+    # unique scratch name so concurrent calls never share the file
+    descriptor, csv_unique = tempfile.mkstemp(suffix='.csv',
+        dir=arcpy.env.scratchFolder)
+    os.close(descriptor)
 
-    # remove duplicate coordinate pairs for coincident polygons
-    DeleteIdentical(in_dataset=output_features, fields=['Shape', 'x', 'y'])
+    try:
+        # remove duplicate coordinate pairs for coincident polygons before
+        # any geometry is built
+        df = read_csv(filepath_or_buffer=input_file)
+        df.drop_duplicates(subset=['x', 'y']).to_csv(path_or_buf=csv_unique,
+            index=False)
+
+        MakeXYEventLayer(table=csv_unique, in_x_field='x', in_y_field='y',
+            out_layer=event_data, spatial_reference=projection)
+        CopyFeatures(in_features=event_data,
+            out_feature_class=output_features)
+    finally:
+        os.remove(csv_unique)
 
 ###############################################################################
 
@@ -246,13 +287,35 @@ def csv_to_gdb(csv, gdb, table):
     csv_to_gdb(csv=r'\\.csv', gdb=r'\\.gdb', table='Output')
     """
 
-    from arcpy.conversion import TableToTable
-
     TableToTable(csv, gdb, table)
 
 ###############################################################################
 
-def cubic_volume(original, current, gdb, polygons):
+def _cut_fill(suffix, original, current, gdb):
+    """Clips both surfaces to one polygon and runs Cut Fill. Called by
+    cubic_volume directly or in a worker process."""
+
+    fc = rf'{gdb}\\input_{suffix}'
+    raster = rf'{gdb}\\cf_{suffix}'
+
+    # private scratch space so workers never share intermediate rasters; the
+    # extensions are checked back in even when a tool fails
+    with extension('SPATIAL'), extension('3D'), \
+        tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as scratch, \
+        arcpy.EnvManager(scratchWorkspace=scratch):
+        # subset rasters within area of interest
+        before_clip = ExtractByMask(in_raster=original, in_mask_data=fc)
+        after_clip = ExtractByMask(in_raster=current, in_mask_data=fc)
+        # outputs area in sq ft and volume in cu yds
+        CutFill(in_before_surface=before_clip, in_after_surface=after_clip,
+            out_raster=raster)
+        del before_clip, after_clip
+
+    return suffix
+
+###############################################################################
+
+def cubic_volume(original, current, gdb, polygons, workers=1):
     """Calculates change in volume between two rasters.
     ---------------------------------------------------------------------------
     PARAMETERS:
@@ -265,6 +328,10 @@ def cubic_volume(original, current, gdb, polygons):
         path to an ArcGIS geodatabase (output workspace)
     polygons: str
         polygon feature class in the gdb which bounds the cut/fill operation
+    workers: int
+        number of processes used to run Cut Fill per polygon; values above 1
+        require the calling script to guard its entry point with
+        if __name__ == '__main__'
     ---------------------------------------------------------------------------
     RETURNS:
     ---------------------------------------------------------------------------
@@ -275,17 +342,12 @@ def cubic_volume(original, current, gdb, polygons):
     ---------------------------------------------------------------------------
     from pyxidust.gp import cubic_volume
     cubic_volume(original=r'\\', current=r'\\', gdb=r'\\.gdb', polygons='Poly')
+    # run Cut Fill per polygon in parallel worker processes
+    if __name__ == '__main__':
+        cubic_volume(original=r'\\', current=r'\\', gdb=r'\\.gdb',
+            polygons='Poly', workers=4)
     """
 
-    import arcpy
-    from arcpy.analysis import Statistics
-    from arcpy.conversion import ExportFeatures
-    from arcpy.da import SearchCursor, UpdateCursor
-    from arcpy.ddd import CutFill
-    from arcpy.management import AddField, CalculateField, DeleteField, Merge
-    from arcpy.sa import ExtractByMask
-    from pyxidust.gp import get_suffix
-
     # full path to input polygons
     boundaries = rf'{gdb}\\{polygons}'
 
@@ -293,100 +355,81 @@ def cubic_volume(original, current, gdb, polygons):
     arcpy.CheckOutExtension('SPATIAL')
     arcpy.CheckOutExtension('3D')
 
-    # global key
-    suffixes = []
+    # global key; workaround numerals in filenames
+    suffixes = suffix_list(total=int(GetCount(boundaries).getOutput(0)))
     # suffix:sum
     sum_values = {}
 
-    # workaround numerals in filenames
-    counter = get_suffix(string='')
-    # access polygons with SHAPE@ geometry token
-    with SearchCursor(boundaries, ['SHAPE@']) as cursor:
-        for row in cursor:
-            # store global key
-            letter = next(counter)
-            suffixes.append(letter)
-            shapefile = rf'input_{letter}'
-            # export row as feature class
-            features = rf'{gdb}\\{shapefile}'
-            ExportFeatures(in_features=row, out_features=features)
-
-    raster_iterator = iter(suffixes)
-    for fc in arcpy.ListFeatureClasses('input*'):
-        try:
-            # link datasets via global key
-            raster_suffix = next(raster_iterator)
-            raster = rf'{gdb}\\cf_{raster_suffix}'
-            # subset rasters within area of interest
-            before_clip = ExtractByMask(in_raster=original, in_mask_data=fc)
-            after_clip = ExtractByMask(in_raster=current, in_mask_data=fc)
-            # outputs area in sq ft and volume in cu yds
-            CutFill(in_before_surface=before_clip, in_after_surface=after_clip,
-                out_raster=raster)
-        except StopIteration:
-            pass
-
-    stats_iterator = iter(suffixes)
-    for fc in arcpy.ListRasters('cf*'):
-        try:
-            stats_suffix = next(stats_iterator)
-            stats = rf'{gdb}\\stats_{stats_suffix}'
-            # cubic volume/sum per raster
-            CalculateField(in_table=fc, field='VOL_CUB_YDS',
-                expression="!VOLUME!/27", expression_type='PYTHON3',
-                field_type='DOUBLE')
-            Statistics(in_table=fc, out_table=stats,
-                statistics_fields=[['VOL_CUB_YDS', 'SUM']])
-        except StopIteration:
-            pass
-
-    search_iterator = iter(suffixes)
-    for fc in arcpy.ListTables('stats*'):
-        with SearchCursor(fc, ['SUM_VOL_CUB_YDS']) as cursor:
-            for row in cursor:
-                try:
-                    # drop decimal/negative
-                    value = round(row[0])
-                    sum_value = (str(value)).replace('-', '')
-                    search_suffix = next(search_iterator)
-                    # sum values per polygon
-                    sum_values.update({search_suffix: sum_value})
-                except StopIteration:
-                    pass
-
-    for fc in arcpy.ListFeatureClasses('input*'):
-        # get global key
-        _, loop_value = fc.split('_')
-        # fields to calculate/store label values and integer sum values
-        AddField(in_table=fc, field_name='LABEL2', field_type='TEXT',
-            field_length=256)
+    # staging feature class holding every polygon with its output name; a
+    # unique name so a failed earlier run cannot block this one
+    staging = arcpy.CreateUniqueName('polygons_all', gdb)
+    CreateFeatureclass(out_path=gdb, out_name=os.path.basename(staging),
+        geometry_type='POLYGON',
+        spatial_reference=arcpy.Describe(boundaries).spatialReference)
+    try:
+        AddField(in_table=staging, field_name='SPLIT', field_type='TEXT',
+            field_length=64)
+        # access polygons with SHAPE@ geometry token
+        with SearchCursor(boundaries, ['SHAPE@']) as search, \
+            InsertCursor(staging, ['SHAPE@', 'SPLIT']) as insert:
+            for row, letter in zip(search, suffixes):
+                insert.insertRow((row[0], rf'input_{letter}'))
+        # one tool call exports each row as an 'input_' feature class
+        SplitByAttributes(Input_Table=staging, Target_Workspace=gdb,
+            Split_Fields=['SPLIT'])
+    finally:
+        Delete(in_data=staging)
+
+    # the split copies the staging field; keep the output schema unchanged
+    for suffix in suffixes:
+        DeleteField(in_table=rf'{gdb}\\input_{suffix}', drop_field=['SPLIT'])
+
+    # polygons are independent; each call writes its own cf_ raster
+    if workers > 1:
+        with process_pool(max_workers=workers) as executor:
+            list(executor.map(_cut_fill, suffixes, repeat(original),
+                repeat(current), repeat(gdb)))
+    else:
+        for suffix in suffixes:
+            _cut_fill(suffix, original, current, gdb)
+
+    # output names are built from the global keys; no catalog listings
+    for suffix in suffixes:
+        raster = rf'{gdb}\\cf_{suffix}'
+        stats = rf'{gdb}\\stats_{suffix}'
+        # cubic volume/sum per raster
+        CalculateField(in_table=raster, field='VOL_CUB_YDS',
+            expression="!VOLUME!/27", expression_type='PYTHON3',
+            field_type='DOUBLE')
+        Statistics(in_table=raster, out_table=stats,
+            statistics_fields=[['VOL_CUB_YDS', 'SUM']])
+
+    for suffix in suffixes:
+        stats = rf'{gdb}\\stats_{suffix}'
+        # single-row table; read without opening a cursor
+        array = TableToNumPyArray(stats, ['SUM_VOL_CUB_YDS'])
+        # drop decimal/negative; sum values per polygon
+        sum_values[suffix] = str(abs(round(float(array[0][0]))))
+
+    # total of the per-polygon sums
+    cubic_yards = sum(int(value) for value in sum_values.values())
+
+    datasets = [rf'{gdb}\\input_{suffix}' for suffix in suffixes]
+
+    for suffix, fc in zip(suffixes, datasets):
+        value = sum_values[suffix]
+        # fields to store label values and integer sum values
         AddField(in_table=fc, field_name='LABEL', field_type='TEXT',
             field_length=256)
         AddField(in_table=fc, field_name='SUM', field_type='SHORT')
-        # initialize return value
-        cubic_yards = 0
-        # write volumes from stats to polygons
+        # write volumes from stats to polygons; 'CY' for pretty labels
         with UpdateCursor(fc, ['LABEL', 'SUM']) as cursor:
             for row in cursor:
-                for key, value in sum_values.items():
-                    # accumulate sum values
-                    cubic_yards += int(value)
-                    if key == loop_value:
-                        # carryover value from raster
-                        CalculateField(in_table=fc, field='LABEL2',
-                            expression=value, expression_type='PYTHON3')
-                        # add 'CY' for pretty labels
-                        CalculateField(in_table=fc, field='LABEL',
-                            expression="!LABEL2! + ' CY'",
-                            expression_type='PYTHON3')
-                        # integer sum values
-                        CalculateField(in_table=fc, field='SUM',
-                            expression=int(value), expression_type='PYTHON3')
-                        # cleanup calculation field
-                        DeleteField(in_table=fc, drop_field='LABEL2')
+                row[0] = f'{value} CY'
+                row[1] = int(value)
+                cursor.updateRow(row)
 
     # merge polygons into final result
-    datasets = [fc for fc in arcpy.ListFeatureClasses('input*')]
     results = rf'{gdb}\\CubicVolume'
     Merge(inputs=datasets, output=results)
 
@@ -420,24 +463,36 @@ def excel_to_gdb(workbook, gdb, table, sheet=None):
         sheet='Sheet 1')
     """
 
-    import os
-    from arcpy.conversion import TableToTable
-    from pandas import DataFrame, read_excel
-
-    csv_excel = (rf'{os.getcwd()}\\excel_to_gdb.csv')
-    
-    if sheet is not None:
-        df = DataFrame(data=read_excel(io=workbook, sheet_name=sheet,
-                engine='openpyxl'))
-        df.to_csv(path_or_buf=csv_excel)
-        TableToTable(csv_excel, gdb, table)
-
-    else:
-        df = DataFrame(data=read_excel(io=workbook, engine='openpyxl'))
-        df.to_csv(path_or_buf=csv_excel)
-        TableToTable(csv_excel, gdb, table)
-
-    os.remove(csv_excel)
+    from pandas import read_excel
+
+    # first sheet unless named
+    df = read_excel(io=workbook, sheet_name=0 if sheet is None else sheet,
+        engine='openpyxl')
+    # field names as TableToTable would sanitize them; headers that collapse
+    # to the same name get a numbered suffix
+    fields = []
+    for column in df.columns:
+        field = name = arcpy.ValidateFieldName(str(column), gdb)
+        number = 0
+        while field in fields:
+            number += 1
+            suffix = f'_{number}'
+            field = arcpy.ValidateFieldName(f'{name}{suffix}', gdb)
+            # a truncated name loses the suffix; shorten the base instead
+            if not field.endswith(suffix):
+                field = f'{name[:len(field) - len(suffix)]}{suffix}'
+        fields.append(field)
+    df.columns = fields
+    # geodatabase tables have no boolean field type
+    flags = df.select_dtypes(include='bool').columns
+    df[flags] = df[flags].astype('int16')
+    # text columns need a fixed width in the structured array
+    text = df.select_dtypes(include='object').columns
+    df[text] = df[text].fillna('').astype(str)
+    widths = {column: f'<U{max([1, *df[column].str.len()])}'
+        for column in text}
+    records = df.to_records(index=False, column_dtypes=widths)
+    NumPyArrayToTable(records, rf'{gdb}\\{table}')
 
 ###############################################################################
 
@@ -457,24 +512,31 @@ def explode_geometry(dataset, gdb):
     explode_geometry(dataset='Polygons', gdb=r'\\.gdb')
     """
 
-    import arcpy
-    from arcpy import AddFieldDelimiters as Delimiter
-    from arcpy.analysis import Select
-    from arcpy.da import SearchCursor
-
     fc = (rf'{gdb}\\{dataset}')
-    # get feature class properties
-    fields = arcpy.Describe(fc).OIDFieldName
-    counter = get_suffix(string='')
+    suffixes = suffix_list(total=int(GetCount(fc).getOutput(0)))
+    # staging copy holding every row with its output name; a unique name so
+    # a failed earlier run cannot block this one
+    staging = arcpy.CreateUniqueName('explode_all', gdb)
+    CopyFeatures(in_features=fc, out_feature_class=staging)
+    try:
+        AddField(in_table=staging, field_name='SPLIT', field_type='TEXT',
+            field_length=64)
 
-    with SearchCursor(fc, fields) as cursor:
-        for row in cursor:
-            letter = next(counter)
-            explode = (rf'{gdb}\\Explode_{letter}')
-            # SQL 'where' clause
-            clause = '{0} = {1}'.format(Delimiter(fc, fields), row[0])
-            # get/export rows
-            Select(fc, explode, clause)
+        with UpdateCursor(staging, ['SPLIT']) as cursor:
+            for row, letter in zip(cursor, suffixes):
+                row[0] = rf'Explode_{letter}'
+                cursor.updateRow(row)
+
+        # one tool call exports each row as an 'Explode_' feature class
+        SplitByAttributes(Input_Table=staging, Target_Workspace=gdb,
+            Split_Fields=['SPLIT'])
+    finally:
+        Delete(in_data=staging)
+
+    # the split copies the staging field; keep the input schema unchanged
+    for suffix in suffixes:
+        DeleteField(in_table=rf'{gdb}\\Explode_{suffix}',
+            drop_field=['SPLIT'])
 
 ###############################################################################
 
@@ -505,89 +567,29 @@ def features_to_csv(input_features, output_file, option, gdb=None):
         option='polygon')
     """
 
-    import json
-    import os
-    import arcpy
-    # import pandas
-
-    from arcpy.conversion import FeaturesToJSON
-    from arcpy.stats import ExportXYv
-    from pandas import json_normalize, read_csv
-
-    json_temp = (rf'{os.getcwd()}\\features_to_csv.json')
-    csv_temp = (rf'{os.getcwd()}\\features_to_csv.csv')
+    # pandas stays lazy so the module imports without it
+    from pandas import DataFrame
 
     arcpy.env.overwriteOutput = True
 
     if option == 'point':
 
-        os.chdir(gdb)
-        arcpy.env.workspace = os.getcwd()
-        ExportXYv(Input_Feature_Class=input_features,
-            Value_Field=['id', 'x', 'y'], Delimiter='COMMA',
-            Output_ASCII_File=csv_temp,
-            Add_Field_Names_to_Output='ADD_FIELD_NAMES')
-        df_csv = read_csv(filepath_or_buffer=csv_temp, sep=',')
-        df_clean = df_csv.loc[:, ['id', 'x', 'y']]
-        df_clean.to_csv(path_or_buf=output_file, index=False)
-        os.remove(csv_temp)
+        # feature class names resolve against the gdb
+        arcpy.env.workspace = gdb
+        array = FeatureClassToNumPyArray(in_table=input_features,
+            field_names=['id', 'x', 'y'])
+        DataFrame(data=array).to_csv(path_or_buf=output_file, index=False)
 
     if option == 'polygon':
 
-        FeaturesToJSON(in_features=input_features,
-            out_json_file=json_temp, format_json='FORMATTED')
-
-        with open(json_temp, 'r') as file:
-            json_file = json.load(file)
-
-        os.remove(json_temp)
-        df_flat = json_normalize(data=json_file, record_path='features',
-            meta=['geometry', 'rings'], errors='ignore')
-        GEO = 'geometry.rings'
-        df_clean = df_flat[GEO]
-        df_exploded = df_clean.explode(GEO).explode(GEO)
-        json_csv = df_exploded.to_csv(path_or_buf=json_temp, index=False)
-
-        with open(json_temp, 'r') as file:
-            text = file.read().replace('[', '').replace(']', '')
-            text = text.replace('"', '').replace(',geometry.rings', '')
-            text = text.replace(' ', '')
-
-        with open(output_file, 'w+') as file:
-            file.write('id,x,y')
-            file.writelines(text)
-
-        os.remove(json_temp)
-
-###############################################################################
-
-def get_suffix(string):
-    """Appends a unique letter combination to the string per each iteration.
-    ---------------------------------------------------------------------------
-    PARAMETERS:
-    ---------------------------------------------------------------------------
-    string: str
-        text value to be appended
-    ---------------------------------------------------------------------------
-    USAGE:
-    ---------------------------------------------------------------------------
-    from pyxidust.gp import get_suffix
-    # create generator to yield values
-    generator = get_suffix(string='filename_')
-    next(generator) -> 'filename_A'
-    next(generator) -> 'filename_B'
-    """
-
-    from string import ascii_uppercase as UPPER
-
-    loops = 1
-
-    while loops > 0:
-        for letter in UPPER:
-            text = f'{string}{letter * loops}'
-            yield text
-            if letter.startswith('Z'):
-                loops += 1
+        # one [x, y] vertex per row; id is the source feature position;
+        # None separates interior rings within a part
+        with SearchCursor(input_features, ['SHAPE@']) as cursor:
+            rows = [(index, point.X, point.Y)
+                for index, (shape,) in enumerate(cursor)
+                for part in shape for point in part if point]
+        df_points = DataFrame(data=rows, columns=['id', 'x', 'y'])
+        df_points.to_csv(path_or_buf=output_file, index=False)
 
 ###############################################################################
 
@@ -637,39 +639,37 @@ def image_to_features(image, classes, identifier, query, projection, directory,
         area='AREA >= 100')
     """
 
-    import arcpy
-    from arcpy.analysis import Select
-    from arcpy.conversion import RasterToPolygon
-    from arcpy.management import CalculateGeometryAttributes
-    from arcpy.sa import ExtractByAttributes, ExtractByMask
-    from arcpy.sa import IsoClusterUnsupervisedClassification
-
     arcpy.env.overwriteOutput = True
     arcpy.env.outputCoordinateSystem = projection
     arcpy.CheckOutExtension('SPATIAL')
 
+    # output location shared by every dataset below
+    prefix = directory.rstrip('\\/') + '\\'
+
     # create raster for all polygons in image per classes
     boundary = IsoClusterUnsupervisedClassification(image, classes)
-    boundary.save(rf'{directory}\\boundary_{identifier}')
+    boundary.save(f'{prefix}boundary_{identifier}')
 
     # retain only desired values per SQL query
     extract = ExtractByAttributes(boundary, query)
-    extract.save(rf'{directory}\\extract_{identifier}')
+    extract.save(f'{prefix}extract_{identifier}')
 
     # convert extracted raster to polygons for use as mask
-    mask = rf'{directory}\\mask_{identifier}'
+    mask = f'{prefix}mask_{identifier}'
     RasterToPolygon(extract, mask, 'SIMPLIFY', '', 'SINGLE_OUTER_PART')
+    # unfiltered mask when no area query is given
+    clean = mask
 
     # use area query to remove small polygons
     if area is not None:
         CalculateGeometryAttributes(in_features=mask,
             geometry_property='AREA AREA', area_unit='SQUARE_FEET_US')
-        clean = rf'{directory}\\clean_{identifier}'
+        clean = f'{prefix}clean_{identifier}'
         Select(mask, clean, area)
 
     # clip image using outer boundary as mask
     extract = ExtractByMask(image, clean)
-    clip = rf'{directory}\\clip_{identifier.lower()}'
+    clip = f'{prefix}clip_{identifier.lower()}'
     extract.save(clip)
 
     arcpy.CheckInExtension('SPATIAL')
@@ -699,8 +699,6 @@ def increment_field(dataset, field_name, field_type, counter):
         counter=1)
     """
 
-    from arcpy.da import UpdateCursor
-
     with UpdateCursor(dataset, [field_name]) as cursor:
         for row in cursor:
             if field_type == 'float':
@@ -715,7 +713,7 @@ def increment_field(dataset, field_name, field_type, counter):
 ###############################################################################
 
 def layout_scale(project, map_name, layout_name, frame_name, layer_index,
-    adjust):
+    adjust, save=True):
     """Adjusts the layout scale to the extent of a layer.
     ---------------------------------------------------------------------------
     PARAMETERS:
@@ -734,6 +732,8 @@ def layout_scale(project, map_name, layout_name, frame_name, layer_index,
     adjust: float
         value used to fine-tune the scale set by the layer_index parameter;
         adjust < 1.0 decreases scale and adjust > 1.0 increases scale
+    save: bool
+        set to False to defer saving the project when chaining multiple calls
     ---------------------------------------------------------------------------
     RETURNS:
     ---------------------------------------------------------------------------
@@ -757,8 +757,6 @@ def layout_scale(project, map_name, layout_name, frame_name, layer_index,
         adjust=0.9)
     """
 
-    import arcpy
-
     map_ = project.listMaps(map_name)[0]
     layout = project.listLayouts(layout_name)[0]
     frame = layout.listElements('MAPFRAME_ELEMENT', frame_name)[0]
@@ -767,11 +765,12 @@ def layout_scale(project, map_name, layout_name, frame_name, layer_index,
     extent = frame.getLayerExtent(layer, True)
     frame.camera.setExtent(extent)
     frame.camera.scale *= adjust
-    arcpy.env.referenceScale = frame.camera.scale
-    map_.referenceScale = arcpy.env.referenceScale
-    scale = map_.referenceScale
+    scale = frame.camera.scale
+    arcpy.env.referenceScale = scale
+    map_.referenceScale = scale
 
-    project.save()
+    if save:
+        project.save()
 
     return extent, scale
 
@@ -803,8 +802,6 @@ def match_values(dataset, key_field, field_map, update_field, update_value):
         update_field=['MATCH'], update_value='Y')
     """
 
-    from arcpy.da import UpdateCursor
-
     field_names = key_field + update_field
 
     with UpdateCursor(dataset, field_names) as cursor:
@@ -842,11 +839,12 @@ def move_elements(project, layout, element, wildcard):
         wildcard='*Info')
     """
 
-    import arcpy
+    # page units far outside the printable area
+    offset = -100000.00
 
     for i in layout.listElements(element, wildcard):
-        i.elementPositionX = -abs(100000.00)
-        i.elementPositionY = -abs(100000.00)
+        i.elementPositionX = offset
+        i.elementPositionY = offset
 
     project.save()
 
@@ -902,9 +900,6 @@ def place_anno(project, map_name, layout_name, frame_name, layer_index,
         adjust=0.9, gdb=r'\\.gdb', suffix='B', layer_name='Points')
     """
 
-    import arcpy
-    from arcpy.cartography import ConvertLabelsToAnnotation
-
     project = project
     map_ = project.listMaps(map_name)[0]
     layout = project.listLayouts(layout_name)[0]
@@ -914,9 +909,9 @@ def place_anno(project, map_name, layout_name, frame_name, layer_index,
     extent = frame.getLayerExtent(layer, True)
     frame.camera.setExtent(extent)
     frame.camera.scale *= adjust
-    arcpy.env.referenceScale = frame.camera.scale
-    map_.referenceScale = arcpy.env.referenceScale
-    scale = map_.referenceScale
+    scale = frame.camera.scale
+    arcpy.env.referenceScale = scale
+    map_.referenceScale = scale
 
     project.save()
 
@@ -935,8 +930,19 @@ def place_anno(project, map_name, layout_name, frame_name, layer_index,
 
 ###############################################################################
 
+def _next_plot(map_):
+    """Returns the next unused 'Plot_N' layer name in a map; numbering picks up
+    after layers saved in the project by earlier sessions."""
+
+    numbers = [layer.name[5:] for layer in map_.listLayers('Plot_*')]
+    last = max((int(i) for i in numbers if i.isdigit()), default=0)
+
+    return f'Plot_{last + 1}'
+
+###############################################################################
+
 def plot_csv(project, map_name, csv, projection, shapefile, event_data, x_name,
-    y_name, z_name=None):
+    y_name, z_name=None, save=True, spatial_reference=None):
     """Converts X/Y/Z coordinates in a .csv file to a shapefile.
     ---------------------------------------------------------------------------
     PARAMETERS:
@@ -952,14 +958,20 @@ def plot_csv(project, map_name, csv, projection, shapefile, event_data, x_name,
     shapefile: str
         path to an output shapefile
     event_data: str
-        path to output event data; exposed to resolve memory conflicts with
-        multiple calls to MakeXYEventLayer (ex. unit testing)
+        name of output event data; exposed to resolve memory conflicts with
+        multiple calls to MakeXYEventLayer (ex. unit testing); always written
+        to the memory workspace and deleted after the shapefile is created
     x_name: str
         field name mapped to longitude values
     y_name: str
         field name mapped to latitude values
     z_name: str
         field name mapped to elevation values
+    save: bool
+        set to False to defer saving the project when chaining multiple calls
+    spatial_reference:
+        ArcGIS spatial reference object built from the projection; pass one
+        to reuse it across calls instead of parsing the .prj each time
     ---------------------------------------------------------------------------
     USAGE:
     ---------------------------------------------------------------------------
@@ -972,40 +984,40 @@ def plot_csv(project, map_name, csv, projection, shapefile, event_data, x_name,
         x_name='X', y_name='Y', z_name='Z')
     """
 
-    import random
-    import arcpy
-    from string import ascii_uppercase as LETTERS
-    
-    letter = random.choice(LETTERS)
-    plot = (f'Plot_{letter}')
-    
     map_ = project.listMaps(map_name)[0]
-    
+    plot = _next_plot(map_)
+
+    # transient event data stays off disk; only the shapefile is written
+    if not event_data.lower().startswith(('memory\\', 'in_memory\\')):
+        event_data = f'memory\\{os.path.basename(event_data)}'
+
+    # .prj is parsed once per call unless the caller supplies the object
+    if spatial_reference is None:
+        spatial_reference = arcpy.SpatialReference(projection)
+
+    event_args = {'table': csv, 'in_x_field': x_name, 'in_y_field': y_name,
+        'out_layer': event_data, 'spatial_reference': spatial_reference}
     if z_name is not None:
-        arcpy.management.MakeXYEventLayer(table=csv, in_x_field=x_name,
-            in_y_field=y_name, out_layer=event_data,
-            spatial_reference=projection, in_z_field=z_name)
-    if z_name is None:
-        arcpy.management.MakeXYEventLayer(table=csv, in_x_field=x_name,
-            in_y_field=y_name, out_layer=event_data,
-            spatial_reference=projection)
-
-    # arcobjects results object
-    csv_plot = arcpy.management.CopyFeatures(in_features=event_data,
+        event_args['in_z_field'] = z_name
+    arcpy.management.MakeXYEventLayer(**event_args)
+
+    arcpy.management.CopyFeatures(in_features=event_data,
         out_feature_class=shapefile)
-    features_csv = arcpy.management.MakeFeatureLayer(in_features=csv_plot,
-        out_layer=plot)
-    
-    # arcpy.mp layer object
-    layer = features_csv.getOutput(0)
-    map_.addLayer(layer)
 
-    project.save()
+    # add the shapefile directly; skips a MakeFeatureLayer re-open
+    layer = map_.addDataFromPath(shapefile)
+    layer.name = plot
+
+    arcpy.management.Delete(event_data)
+
+    if save:
+        project.save()
 
 ###############################################################################
 
 def plot_excel(workbook, project, map_name, projection, shapefile, event_data,
-    x_name, y_name, z_name=None, sheet=None):
+    x_name, y_name, z_name=None, sheet=None, spatial_reference=None,
+    save=True):
     """Converts X/Y/Z coordinates in an Excel workbook to a shapefile.
     ---------------------------------------------------------------------------
     PARAMETERS:
@@ -1032,6 +1044,10 @@ def plot_excel(workbook, project, map_name, projection, shapefile, event_data,
     sheet: str
         spreadsheet name if the sheet to be converted is not the first sheet
         in the workbook
+    spatial_reference:
+        ArcGIS spatial reference object passed through to plot_csv
+    save: bool
+        set to False to defer saving the project when chaining multiple calls
     ---------------------------------------------------------------------------
     USAGE:
     ---------------------------------------------------------------------------
@@ -1048,42 +1064,17 @@ def plot_excel(workbook, project, map_name, projection, shapefile, event_data,
         x_name='X', y_name='Y', sheet='Sheet 3')
     """
     
-    import os
-    from pandas import DataFrame, read_excel
+    # workbook is read natively into a scratch table; no .csv on disk
+    plot_excel = r'memory\excel_plot'
+    arcpy.conversion.ExcelToTable(Input_Excel_File=workbook,
+        Output_Table=plot_excel, Sheet=sheet)
 
-    plot_excel = (rf'{os.getcwd()}\\excel_plot.csv')
-    
-    if sheet is None and z_name is None:
-        df = DataFrame(data=read_excel(io=workbook, engine='openpyxl'))
-        df.to_csv(path_or_buf=plot_excel)
-        plot_csv(project=project, map_name=map_name, csv=plot_excel,
-            projection=projection, shapefile=shapefile, event_data=event_data,
-            x_name=x_name, y_name=y_name)
-
-    elif sheet is not None and z_name is None:
-        df = DataFrame(data=read_excel(io=workbook, sheet_name=sheet,
-            engine='openpyxl'))
-        df.to_csv(path_or_buf=plot_excel)
-        plot_csv(project=project, map_name=map_name, csv=plot_excel,
-            projection=projection, shapefile=shapefile, event_data=event_data,
-            x_name=x_name, y_name=y_name)
-
-    elif sheet is None and z_name is not None:
-        df = DataFrame(data=read_excel(io=workbook, engine='openpyxl'))
-        df.to_csv(path_or_buf=plot_excel)
-        plot_csv(project=project, map_name=map_name, csv=plot_excel,
-            projection=projection, shapefile=shapefile, event_data=event_data,
-            x_name=x_name, y_name=y_name, z_name=z_name)
-
-    elif sheet is not None and z_name is not None:
-        df = DataFrame(data=read_excel(io=workbook, sheet_name=sheet,
-            engine='openpyxl'))
-        df.to_csv(path_or_buf=plot_excel)
-        plot_csv(project=project, map_name=map_name, csv=plot_excel,
-            projection=projection, shapefile=shapefile, event_data=event_data,
-            x_name=x_name, y_name=y_name, z_name=z_name)
-
-    os.remove(plot_excel)
+    plot_csv(project=project, map_name=map_name, csv=plot_excel,
+        projection=projection, shapefile=shapefile, event_data=event_data,
+        x_name=x_name, y_name=y_name, z_name=z_name,
+        spatial_reference=spatial_reference, save=save)
+
+    arcpy.management.Delete(plot_excel)
 
 ###############################################################################
 
@@ -1104,16 +1095,18 @@ def print_info(project):
     print_info(project=project)
     """
     
-    import arcpy
+    lines = [f'Layout names: {[i.name for i in project.listLayouts()]}\n']
 
-    print(f'Layout names: {[i.name for i in project.listLayouts()]}\n')
-    
     for id_, map_ in enumerate(project.listMaps(), start=1):
-        for layer in map_.listLayers():
-            if layer.isFeatureLayer:
-                print(f'Map #{id_} ({map_.name})')
-                print(f'{layer.name} layer source: {layer.dataSource}')
-                
+        feature_layers = [i for i in map_.listLayers() if i.isFeatureLayer]
+        # one header per map instead of one per layer
+        if feature_layers:
+            lines.append(f'Map #{id_} ({map_.name})')
+        for layer in feature_layers:
+            lines.append(f'{layer.name} layer source: {layer.dataSource}')
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+
 ###############################################################################
 
 def print_layers(project, map_name):
@@ -1134,176 +1127,48 @@ def print_layers(project, map_name):
     print_layers(project=project, map_name='Map')
     """
     
-    import arcpy
-    
     map_ = project.listMaps(map_name)[0]
     layers = map_.listLayers()
-    
+
+    # horizontal rule between report sections
+    rule = f'\n{"_"*79}\n\n'
+
     for layer in layers:
 
-        if layer.isGroupLayer == False:
-            print(f'\n{"_"*79}\n\n')
-            
-            try:
-                if layer.supports('NAME'):
-                    print(f'Layer name: {layer.name}')
-            except Exception as e:
-                print(e)
-                
-            try:
-                if layer.supports('LONGNAME'):
-                    print(f'Group name: {layer.longName}')
-            except Exception as e:
-                print(e)
-                
-            try:
-                if layer.is3DLayer:
-                    print(f'3D layer = True')
-            except Exception as e:
-                print(e)
-                
-            try:
-                if layer.isWebLayer:
-                    print(f'Web layer = True')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.isSceneLayer:
-                    print(f'Scene layer = True')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.isTimeEnabled:
-                    print(f'Time enabled = True')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.isRasterLayer:
-                    print(f'Raster layer = True')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.isBasemapLayer:
-                    print(f'Basemap layer = True')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.isFeatureLayer:
-                    print(f'Feature layer = True')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.isBroken:
-                    print(f'Broken data source = True')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.supports('VISIBLE'):
-                    print(f'Visible = {layer.visible}')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.isNetworkAnalystLayer:
-                    print(f'Network analyst layer = True')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.isNetworkDatasetLayer:
-                    print(f'Network dataset layer = True')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.supports('SHOWLABELS'):
-                    print(f'Labels on = {layer.showLabels}')
-            except Exception as e:
-                print(e)
-
-            print(f'\n{"_"*79}\n\n')
-            
-            try:
-                if layer.supports('TIME'):
-                    print(f'Time: {layer.time}')
-            except Exception as e:
-                print(e)
-            
-            try:
-                if layer.supports('CONTRAST'):
-                    print(f'Contrast: {layer.contrast}')
-            except Exception as e:
-                print(e)
-            
-            try:
-                if layer.supports('BRIGHTNESS'):
-                    print(f'Brightness: {layer.brightness}')
-            except Exception as e:
-                print(e)
-            
-            try:
-                if layer.supports('TRANSPARENCY'):
-                    print(f'Transparency: {layer.transparency}')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.supports('MINTHRESHOLD'):
-                    print(f'Min display scale: {layer.minThreshold}')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.supports('MAXTHRESHOLD'):
-                    print(f'Max display scale: {layer.maxThreshold}')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.supports('DEFINITIONQUERY'):
-                    print(f'Query: {layer.definitionQuery}')
-            except Exception as e:
-                print(e)
-
-            print(f'\n{"_"*79}\n\n')
-
-            try:
-                if layer.supports('URI'):
-                    print(f'Universal resource indicator: {layer.URI}')
-            except Exception as e:
-                print(e)
-                
-            try:
-                if layer.supports('DATASOURCE'):
-                    print(f'Source: {layer.dataSource}')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.supports('CONNECTIONPROPERTIES'):
-                    print(f'Connection: {layer.connectionProperties}')
-            except Exception as e:
-                print(e)
-
-            try:
-                if layer.supports('METADATA'):
-                    print(f'\n{"_"*79}\n\n')
-                    meta = layer.metadata
-                    print(f'Metadata title: {meta.title}')
-                    print(f'Metadata description: {meta.description}')
-            except Exception as e:
-                print(e)
+        # basemap/group layers are skipped; broken layers get one line
+        if layer.isGroupLayer or layer.isBasemapLayer:
+            continue
+        if layer.isBroken:
+            sys.stdout.write(f'BROKEN: {layer.name}\n')
+            continue
+
+        supports = layer.supports
+        # one write per layer instead of one print per line
+        parts = [rule]
+
+        # one report section per group of supported properties; the rule
+        # after the last section belongs to the metadata block
+        for number, section in enumerate(_LAYER_PROPS):
+            if number:
+                parts.append(rule)
+            for capability, line, attribute in section:
+                if capability is None:
+                    if getattr(layer, attribute):
+                        parts.append(line)
+                elif supports(capability):
+                    parts.append(line.format(getattr(layer, attribute)))
+
+        if supports('METADATA'):
+            parts.append(rule)
+            meta = layer.metadata
+            parts.append(f'Metadata title: {meta.title}')
+            parts.append(f'Metadata description: {meta.description}')
+
+        sys.stdout.write('\n'.join(parts) + '\n')
 
 ###############################################################################
 
-def remove_layers(project, map_, layers):
+def remove_layers(project, map_, layers, save=True):
     """Removes layers from a map in an ArcGIS PRO project.
     ---------------------------------------------------------------------------
     PARAMETERS:
@@ -1312,8 +1177,11 @@ def remove_layers(project, map_, layers):
         ArcGIS project object
     map_:
         ArcGIS map object
-    layers: set
-        layer names to remove as they appear in the map table of contents
+    layers: iterable
+        layer names to remove as they appear in the map table of contents;
+        any set/list/tuple of names is accepted (matching is case-sensitive)
+    save: bool
+        set to False to defer saving the project when chaining multiple calls
     ---------------------------------------------------------------------------
     USAGE:
     ---------------------------------------------------------------------------
@@ -1324,19 +1192,22 @@ def remove_layers(project, map_, layers):
     remove_layers(project=project, map_=map_, layers={'Points', 'Polygons'})
     """
 
-    import arcpy
+    # set membership for every layer regardless of the container passed
+    layers = frozenset(layers)
 
-    for layer in map_.listLayers():
-        if layer.isFeatureLayer:
-            if layer.name in layers:
-                layer_remove = map_.listLayers(layer.name)[0]
-                map_.removeLayer(layer_remove)
+    # resolve matches in one pass; iterated layers are valid handles
+    layers_remove = [layer for layer in map_.listLayers()
+        if layer.isFeatureLayer and layer.name in layers]
 
-    project.save()
+    for layer in layers_remove:
+        map_.removeLayer(layer)
+
+    if layers_remove and save:
+        project.save()
 
 ###############################################################################
 
-def visible_layers(project, map_name, layer_index, option):
+def visible_layers(project, map_name, layer_index, option, save=True):
     """Turns on/off layers in an ArcGIS PRO project.
     ---------------------------------------------------------------------------
     PARAMETERS:
@@ -1349,6 +1220,8 @@ def visible_layers(project, map_name, layer_index, option):
         list of integers corresponding to map layer indexes
     option: str
         use option 'on' or 'off' to control layer visibility
+    save: bool
+        set to False to defer saving the project when chaining multiple calls
     ---------------------------------------------------------------------------
     USAGE:
     ---------------------------------------------------------------------------
@@ -1363,16 +1236,25 @@ def visible_layers(project, map_name, layer_index, option):
         option='off')
     """
 
-    import arcpy
+    if option == 'on':
+        visible = True
+    elif option == 'off':
+        visible = False
+    else:
+        raise ValueError(f"option must be 'on' or 'off', not {option!r}")
 
     map_ = project.listMaps(map_name)[0]
+    layers = map_.listLayers()
+    changed = False
+
+    # accept index values passed as strings
+    indexes = [int(element) for element in layer_index]
 
-    for element in layer_index:
-        layer = map_.listLayers()[element]
+    for index in indexes:
+        layer = layers[index]
         if layer.isFeatureLayer:
-            if option == 'on':
-                layer.visible = True
-            if option == 'off':
-                layer.visible = False
+            layer.visible = visible
+            changed = True
 
-    project.save()
+    if changed and save:
+        project.save()
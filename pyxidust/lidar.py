@@ -3,17 +3,114 @@
 """Lidar automation suite for working with raw point cloud data."""
 ###############################################################################
 
+import glob
+import os
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import repeat
+
+import arcpy
+from arcpy import metadata as md
+from arcpy.conversion import LasDatasetToRaster
+from arcpy.management import CreateLasDataset, LasPointStatsAsRaster
+from arcpy.sa import Con, Float, IsNull, Minus
+from pyxidust.config import LEVELS
+from pyxidust.utils import HELD, extension, folder_signature, process_pool
+
+# LAS dataset layers built in this process keyed by (lasd, class code)
+_LAS_LAYERS = {}
+
+# arcpy.env settings copied into run_pipeline worker processes
+_WORKER_ENV = ('cellSize', 'compression', 'overwriteOutput',
+    'parallelProcessingFactor', 'pyramid', 'tileSize')
+
+###############################################################################
+
+def _add_to_terrain(terrain, multipoint):
+    """Adds multipoint mass points to a terrain; the tool is retried once as a
+    workaround for a bug in PRO where the first call can fail.
+    """
+
+    for attempt in range(2):
+        try:
+            arcpy.ddd.AddFeatureClassToTerrain(terrain, [multipoint, 'Shape',
+                'Mass_Points', 1, 0, 0, True, False, 'Multi_embed', '<None>',
+                False])
+            break
+        # remove the retry when resolved in future version
+        except arcpy.ExecuteError:
+            if attempt:
+                raise
+
+###############################################################################
+
+def _import_metadata(pairs):
+    """Imports FGDC metadata into each (dataset, .xml) pair and saves it;
+    datasets that were not produced (ex. skipped pipeline steps) are ignored.
+    """
+
+    for key, value in pairs:
+        if not arcpy.Exists(key):
+            continue
+        dataset = md.Metadata(key)
+        dataset.importMetadata(value, 'FGDC_CSDGM')
+        dataset.save()
+
+###############################################################################
+
+def _init_worker(settings):
+    """Applies the parent process arcpy environment to a pipeline worker.
+    """
+
+    for name, value in settings.items():
+        setattr(arcpy.env, name, value)
+
+    # one license checkout per worker instead of one per function call
+    for name in ('SPATIAL', '3D'):
+        arcpy.CheckOutExtension(name)
+        HELD.add(name)
+
+###############################################################################
+
+def _las_layer(lasd, class_code=None):
+    """Returns a LAS dataset layer name filtered to a class code; each layer is
+    built once per process and reused by later calls.
+    """
+
+    key = (lasd, class_code)
+    layer = _LAS_LAYERS.get(key)
+
+    if layer is None or not arcpy.Exists(layer):
+        layer = f'LAS_{abs(hash(key))}'
+        codes = {} if class_code is None else {'class_code': class_code}
+        arcpy.management.MakeLasDatasetLayer(lasd, layer, **codes)
+        _LAS_LAYERS[key] = layer
+
+    return layer
+
+###############################################################################
+
+def _point_files(output_folder, compressed=False):
+    """Returns the point cloud folder and file suffix; the caller chooses the
+    .zlas files written by the zlas function or the raw .las files.
+    """
+
+    if compressed:
+        return rf'{output_folder}\\zLAS', 'zlas'
+
+    return rf'{output_folder}\\LAS', 'las'
+
+###############################################################################
+
 def aspect(output_folder):
     """Creates a high-resolution aspect raster from a digital elevation model.
     """
 
-    import arcpy
-
     dem = (rf'{output_folder}\\DEM\\dem.tif')
-    arcpy.CheckOutExtension('SPATIAL')
-    aspect = arcpy.sa.SurfaceParameters(dem, 'ASPECT')
-    aspect.save(rf'{output_folder}\\Aspect\\aspect.tif')
-    arcpy.CheckInExtension('SPATIAL')
+    with extension('SPATIAL'):
+        aspect = arcpy.sa.SurfaceParameters(dem, 'ASPECT')
+        aspect.save(rf'{output_folder}\\Aspect\\aspect.tif')
 
 ###############################################################################
 
@@ -21,8 +118,6 @@ def buildings(output_folder):
     """Creates 3D building patches from raw .las files.
     """
 
-    import arcpy
-
     buildings_db = (rf'{output_folder}\\Buildings\\Buildings.gdb')
     bdactive = (rf'{buildings_db}\\BuildingsCurrent')
     bdpatch = (rf'{buildings_db}\\Buildings3D')
@@ -30,11 +125,10 @@ def buildings(output_folder):
     dem = (rf'{output_folder}\\DEM\\dem.tif')
     lasd = (rf'{output_folder}\\LASD\\Working.lasd')
 
-    arcpy.CheckOutExtension('3D')
-    arcpy.ddd.ClassifiyLasBuilding(lasd, 1, 1, '', 'MAXOF', bdregion)
-    arcpy.ddd.LasBuildingMultipatch(lasd, bdactive, dem, bdpatch,
-        'LAYER_FILTERED_POINTS', '0.5 Feet')
-    arcpy.CheckInExtension('3D')
+    with extension('3D'):
+        arcpy.ddd.ClassifyLasBuilding(lasd, 1, 1, '', 'MAXOF', bdregion)
+        arcpy.ddd.LasBuildingMultipatch(lasd, bdactive, dem, bdpatch,
+            'LAYER_FILTERED_POINTS', '0.5 Feet')
 
 ###############################################################################
 
@@ -48,19 +142,19 @@ def contours(output_folder, base_contour):
         elevations below the given threshold
     """
 
-    import arcpy
-
     contours_db = (rf'{output_folder}\\Contours\\Contours.gdb')
     contours_five = (rf'{contours_db}\\Contours5ft')
     contours_ten = (rf'{contours_db}\\Contours10ft')
     contours_twenty = (rf'{contours_db}\\Contours20ft')
     mean = (rf'{output_folder}\\Mean\\mean.tif')
 
-    arcpy.CheckOutExtension('SPATIAL')
-    arcpy.sa.Contour(mean, contours_five, 5, base_contour)
-    arcpy.sa.Contour(mean, contours_ten, 10, base_contour)
-    arcpy.sa.Contour(mean, contours_twenty, 20, base_contour)
-    arcpy.CheckInExtension('SPATIAL')
+    with extension('SPATIAL'):
+        # one raster scan; every 10/20 ft line is also a 5 ft line
+        arcpy.sa.Contour(mean, contours_five, 5, base_contour)
+
+    for interval, output in ((10, contours_ten), (20, contours_twenty)):
+        arcpy.analysis.Select(contours_five, output,
+            f'MOD(Contour - {base_contour}, {interval}) = 0')
 
 ###############################################################################
 
@@ -68,74 +162,91 @@ def dem(output_folder):
     """Creates a high-resolution digital elevation model from raw .las files.
     """
 
-    import arcpy
-
     dem = (rf'{output_folder}\\DEM\\dem.tif')
     lasd = (rf'{output_folder}\\LASD\\Working.lasd')
-    arcpy.management.MakeLasDatasetLayer(lasd, 'TODEM', class_code = 2)
-    arcpy.conversion.LasDatasetToRaster('TODEM', dem, 'ELEVATION',
+    ground = _las_layer(lasd, class_code=2)
+    arcpy.conversion.LasDatasetToRaster(ground, dem, 'ELEVATION',
         'TRIANGULATION NATURAL_NEIGHBOR WINDOW_SIZE MAXIMUM 0',
         'FLOAT', 'OBSERVATIONS', 50000)
 
 ###############################################################################
 
+def dem_and_dsm(output_folder):
+    """Creates the digital elevation and surface models in two concurrent
+    processes; the DSM keeps building points in class 1 unless buildings has
+    already classified them.
+    ---------------------------------------------------------------------------
+    USAGE:
+    ---------------------------------------------------------------------------
+    from pyxidust import lidar
+    # worker processes require the calling script to guard its entry point
+    if __name__ == '__main__':
+        lidar.dem_and_dsm(output_folder=r'\\')
+    """
+
+    settings = {name: getattr(arcpy.env, name) for name in _WORKER_ENV}
+    # each process gets half the cores so the pair does not oversubscribe
+    settings['parallelProcessingFactor'] = '50%'
+
+    with process_pool(max_workers=2, initializer=_init_worker,
+        initargs=(settings,)) as executor:
+        futures = [executor.submit(function, output_folder)
+            for function in (dem, dsm)]
+
+    # re-raises any error from the workers
+    for future in futures:
+        future.result()
+
+###############################################################################
+
 def dem_shade(output_folder):
     """Creates a high-resolution hillshade raster from a digital elevation
     model.
     """
 
-    import arcpy
-
     dem = (rf'{output_folder}\\DEM\\dem.tif')
     hillshade_dem = arcpy.ia.Hillshade(dem, '', '', 3, 'DEGREE', '', '', '', 1)
     hillshade_dem.save(rf'{output_folder}\\HillshadeDEM\\hillshadedem.tif')
 
 ###############################################################################
 
-def dem_terrain(output_folder, projection):
+def dem_terrain(output_folder, projection, compressed=False):
     """Creates a medium-resolution terrain model from raw .las files.
     ---------------------------------------------------------------------------
     PARAMETERS:
     ---------------------------------------------------------------------------
     projection: str
         path to a ArcGIS projection file used in the LAS To Multipoint tool
+    compressed: bool
+        read the .zlas files from the zlas function instead of the raw .las
     """
 
-    import arcpy
-    from pyxidust.config import LEVELS
-    
-    las = (rf'{output_folder}\\LAS')
+    las, suffix = _point_files(output_folder, compressed)
     terraindem_db = (rf'{output_folder}\\TerrainDEM\\TerrainDEM.gdb')
     multidem = (rf'{terraindem_db}\\TDEM\\Multi')
     terraindem = (rf'{terraindem_db}\\TDEM\\Terrain_DEM')
     terraindem_fd = (rf'{terraindem_db}\\TDEM')
-
-    arcpy.CheckOutExtension('3D')
-    arcpy.ddd.LASToMultipoint(las, multidem, 1.31, 2, 'ANY_RETURNS', '',
-        projection, 'las', 1, 'NO_RECURSION')
-    arcpy.ddd.CreateTerrain(terraindem_fd, 'Terrain_DEM', 1.31, 100000, '',
-        'WINDOWSIZE', 'ZMEAN', 'NONE', 1)
-    arcpy.ddd.AddTerrainPyramidLevel(terraindem, 'WINDOWSIZE', LEVELS)
-
-    try:
-        arcpy.ddd.AddFeatureClassToTerrain(terraindem, [multidem, 'Shape',
-            'Mass_Points', 1, 0, 0, True, False, 'Multi_embed', '<None>',
-            False])
-    except:
-        pass
-
-    # workaround for bug in PRO; remove when resolved in future version
-    try:
-        arcpy.ddd.AddFeatureClassToTerrain(terraindem, [multidem, 'Shape',
-            'Mass_Points', 1, 0, 0, True, False, 'Multi_embed', '<None>',
-            False])
-    except:
-        pass
-
-    finally:
+    # input signature stored beside the gdb; matching inputs skip the rebuild
+    cache = (rf'{output_folder}\\TerrainDEM\\terrain.sig')
+    signature = folder_signature(las, projection)
+
+    if arcpy.Exists(terraindem) and os.path.isfile(cache):
+        with open(cache, 'r') as file:
+            if file.read() == signature:
+                return
+
+    with extension('3D'):
+        arcpy.ddd.LASToMultipoint(las, multidem, 1.31, 2, 'ANY_RETURNS', '',
+            projection, suffix, 1, 'NO_RECURSION')
+        arcpy.ddd.CreateTerrain(terraindem_fd, 'Terrain_DEM', 1.31, 100000,
+            '', 'WINDOWSIZE', 'ZMEAN', 'NONE', 1)
+        arcpy.ddd.AddTerrainPyramidLevel(terraindem, 'WINDOWSIZE', LEVELS)
+
+        _add_to_terrain(terraindem, multidem)
         arcpy.ddd.BuildTerrain(terraindem, '')
 
-    arcpy.CheckInExtension('3D')
+    with open(cache, 'w') as file:
+        file.write(signature)
 
 ###############################################################################
 
@@ -143,12 +254,10 @@ def dsm(output_folder):
     """Creates a high-resolution digital surface model from raw .las files.
     """
 
-    import arcpy
-
     dsm = (rf'{output_folder}\\DSM\\dsm.tif')
     lasd = (rf'{output_folder}\\LASD\\Working.lasd')
-    arcpy.management.MakeLasDatasetLayer(lasd, 'TODSM', 1)
-    arcpy.conversion.LasDatasetToRaster('TODSM', dsm, 'ELEVATION',
+    first = _las_layer(lasd, class_code=1)
+    arcpy.conversion.LasDatasetToRaster(first, dsm, 'ELEVATION',
         'BINNING MAXIMUM NATURAL_NEIGHBOR', 'FLOAT', 'OBSERVATIONS', 50000)
 
 ###############################################################################
@@ -158,58 +267,49 @@ def dsm_shade(output_folder):
     model.
     """
 
-    import arcpy
-
     dsm = (rf'{output_folder}\\DSM\\dsm.tif')
     hillshade_dsm = arcpy.ia.Hillshade(dsm, '', '', 3, 'DEGREE', '', '', '', 1)
     hillshade_dsm.save(rf'{output_folder}\\HillshadeDSM\\hillshadedsm.tif')
 
 ###############################################################################
 
-def dsm_terrain(output_folder, projection):
+def dsm_terrain(output_folder, projection, compressed=False):
     """Creates a medium-resolution terrain model from raw .las files.
     ---------------------------------------------------------------------------
     PARAMETERS:
     ---------------------------------------------------------------------------
     projection: str
         path to a ArcGIS projection file used in the LAS To Multipoint tool
+    compressed: bool
+        read the .zlas files from the zlas function instead of the raw .las
     """
 
-    import arcpy
-    from pyxidust.config import LEVELS
-
-    las = (rf'{output_folder}\\LAS')
+    las, suffix = _point_files(output_folder, compressed)
     terraindsm_db = (rf'{output_folder}\\TerrainDSM\\TerrainDSM.gdb')
     multidsm = (rf'{terraindsm_db}\\TDSM\\Multi')        
     terraindsm = (rf'{terraindsm_db}\\TDSM\\Terrain_DSM')
     terraindsm_fd = (rf'{terraindsm_db}\\TDSM')
-
-    arcpy.CheckOutExtension('3D')
-    arcpy.ddd.LASToMultipoint(las, multidsm, 1.31, '', 1, '', projection,
-        'las', 1, 'NO_RECURSION')
-    arcpy.ddd.CreateTerrain(terraindsm_fd, 'Terrain_DSM', 1.31, 100000, '',
-        'WINDOWSIZE', 'ZMAX', 'NONE', 1)
-    arcpy.ddd.AddTerrainPyramidLevel(terraindsm, 'WINDOWSIZE', LEVELS)
-
-    try:
-        arcpy.ddd.AddFeatureClassToTerrain(terraindsm, [multidsm, 'Shape',
-            'Mass_Points', 1, 0, 0, True, False, 'Multi_embed', '<None>',
-            False])
-    except:
-        pass
-
-    # workaround for bug in PRO; remove when resolved in future version
-    try:
-        arcpy.ddd.AddFeatureClassToTerrain(terraindsm, [multidsm, 'Shape',
-            'Mass_Points', 1, 0, 0, True, False, 'Multi_embed', '<None>',
-            False])
-    except:
-        pass
-
-    finally:
+    # input signature stored beside the gdb; matching inputs skip the rebuild
+    cache = (rf'{output_folder}\\TerrainDSM\\terrain.sig')
+    signature = folder_signature(las, projection)
+
+    if arcpy.Exists(terraindsm) and os.path.isfile(cache):
+        with open(cache, 'r') as file:
+            if file.read() == signature:
+                return
+
+    with extension('3D'):
+        arcpy.ddd.LASToMultipoint(las, multidsm, 1.31, '', 1, '', projection,
+            suffix, 1, 'NO_RECURSION')
+        arcpy.ddd.CreateTerrain(terraindsm_fd, 'Terrain_DSM', 1.31, 100000,
+            '', 'WINDOWSIZE', 'ZMAX', 'NONE', 1)
+        arcpy.ddd.AddTerrainPyramidLevel(terraindsm, 'WINDOWSIZE', LEVELS)
+
+        _add_to_terrain(terraindsm, multidsm)
         arcpy.ddd.BuildTerrain(terraindsm, '')
 
-    arcpy.CheckInExtension('3D')
+    with open(cache, 'w') as file:
+        file.write(signature)
 
 ###############################################################################
 
@@ -217,17 +317,15 @@ def intensity(output_folder):
     """Creates a high-resolution intensity raster from raw .las files.
     """
 
-    import arcpy
-
     intensity = (rf'{output_folder}\\Intensity\\intensity.tif')
     lasd = (rf'{output_folder}\\LASD\\Working.lasd')
-    arcpy.management.MakeLasDatasetLayer(lasd, 'TOINTENSITY')
-    arcpy.conversion.LasDatasetToRaster('TOINTENSITY', intensity, 'INTENSITY',
+    points = _las_layer(lasd)
+    arcpy.conversion.LasDatasetToRaster(points, intensity, 'INTENSITY',
         'BINNING AVERAGE LINEAR', 'INT', 'OBSERVATIONS', 50000)
 
 ###############################################################################
 
-def lasd(output_folder, projection):
+def lasd(output_folder, projection, compressed=False, pyramid=False):
     """Creates a LASD dataset for further lidar processing.
     ---------------------------------------------------------------------------
     PARAMETERS:
@@ -235,14 +333,20 @@ def lasd(output_folder, projection):
     projection: str
         path to an ArcGIS projection file of the desired output coordinate
         reference system
+    compressed: bool
+        reference the .zlas files from the zlas function instead of the raw
+        .las files; classification tools such as buildings cannot edit .zlas
+    pyramid: bool
+        build a LASD point pyramid for faster drawing in ArcGIS PRO; only
+        display uses it, none of the pipeline tools read it
     """
-    
-    import arcpy
-    
-    las = (rf'{output_folder}\\LAS')
+
+    las, _ = _point_files(output_folder, compressed)
     lasd = (rf'{output_folder}\\LASD\\Working.lasd')
     arcpy.management.CreateLasDataset(las, lasd, 'NO_RECURSION', '',
         projection, 'COMPUTE_STATS', 'ABSOLUTE_PATHS', 'NO_FILES')
+    if pyramid:
+        arcpy.management.BuildLasDatasetPyramid(lasd)
 
 ###############################################################################
 
@@ -250,95 +354,91 @@ def mean(output_folder):
     """Creates a mean elevation surface from raw .las files.
     """
 
-    import arcpy
-
     dem = (rf'{output_folder}\\DEM\\dem.tif')
-    arcpy.CheckOutExtension('SPATIAL')
-    mean = arcpy.sa.FocalStatistics(dem, '', 'MEAN')
-    mean.save(rf'{output_folder}\\Mean\\mean.tif')
-    arcpy.CheckInExtension('SPATIAL')
+    with extension('SPATIAL'):
+        mean = arcpy.sa.FocalStatistics(dem, '', 'MEAN')
+        mean.save(rf'{output_folder}\\Mean\\mean.tif')
 
 ###############################################################################
 
-def metadata(output_folder):
-    """Overwrites previous year with current year in all .xml files.
+def _rewrite_year(file, previous_year, new_year):
+    """Replaces the previous year with the new year in one .xml file.
     """
 
-    import glob
-    import os
-    import time
-    from arcpy import metadata as md
+    with open(file, 'r') as xml:
+        text = xml.read()
 
-    terraindem_db = (rf'{output_folder}\\TerrainDEM\\TerrainDEM.gdb')
-    terraindsm_db = (rf'{output_folder}\\TerrainDSM\\TerrainDSM.gdb')
-    buildings_db = (rf'{output_folder}\\Buildings\\Buildings.gdb')
-    contours_db = (rf'{output_folder}\\Contours\\Contours.gdb')
+    # files without the previous year need no rewrite and are left untouched
+    if previous_year not in text:
+        return
 
-    hillshadedem = (rf'{output_folder}\\HillshadeDEM\\hillshadedem.tif')
-    hillshadedsm = (rf'{output_folder}\\HillshadeDSM\\hillshadedsm.tif')
-    intensity = (rf'{output_folder}\\Intensity\\intensity.tif')
-    terraindem = (rf'{terraindem_db}\\TDEM\\Terrain_DEM')
-    terraindsm = (rf'{terraindsm_db}\\TDSM\\Terrain_DSM')
-    contours_twenty = (rf'{contours_db}\\Contours20ft')
-    aspect = (rf'{output_folder}\\Aspect\\aspect.tif')
-    range_r = (rf'{output_folder}\\Range\\range.tif')
-    contours_five = (rf'{contours_db}\\Contours5ft')
-    contours_ten = (rf'{contours_db}\\Contours10ft')
-    slope = (rf'{output_folder}\\Slope\\slope.tif')    
-    mean = (rf'{output_folder}\\Mean\\mean.tif')
-    bdpatch = (rf'{buildings_db}\\Buildings3D')
-    dem = (rf'{output_folder}\\DEM\\dem.tif')
-    dsm = (rf'{output_folder}\\DSM\\dsm.tif')
-    
-    # add tree canopy height/density datasets here
-    ...
+    # write beside the original and swap it in atomically
+    with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(file),
+        suffix='.tmp', delete=False) as xml:
+        xml.write(text.replace(previous_year, new_year))
+    os.replace(xml.name, file)
+
+###############################################################################
+
+def metadata(output_folder, workers=1):
+    """Overwrites previous year with current year in all .xml files.
+    ---------------------------------------------------------------------------
+    PARAMETERS:
+    ---------------------------------------------------------------------------
+    workers: int
+        number of processes importing metadata into the datasets; values
+        above 1 require the calling script to guard its entry point with
+        if __name__ == '__main__'
+    """
 
     meta = (rf'{output_folder}\\Metadata')
-    contourstwenty_meta = (rf'{meta}\\Contours20ft.xml')
-    hillshadedem_meta = (rf'{meta}\\Hillsahdedem.xml')
-    hillshadedsm_meta = (rf'{meta}\\Hillshadedsm.xml')    
-    contoursfive_meta = (rf'{meta}\\Contours5ft.xml')
-    contoursten_meta = (rf'{meta}\\Contours10ft.xml')    
-    buildings_meta = (rf'{meta}\\Buildings3D.xml')
-    terraindem_meta = (rf'{meta}\\TerrainDEM.xml')
-    terraindsm_meta = (rf'{meta}\\TerrainDSM.xml')
-    intensity_meta = (rf'{meta}\\Intensity.xml')
-    aspect_meta = (rf'{meta}\\Aspect.xml')
-    range_meta = (rf'{meta}\\Range.xml')
-    slope_meta = (rf'{meta}\\Slope.xml')
-    mean_meta = (rf'{meta}\\Mean.xml')    
-    dem_meta = (rf'{meta}\\DEM.xml')
-    dsm_meta = (rf'{meta}\\DSM.xml')
-
-    # add tree canopy height/density xml here
-    ...
+
+    # .xml name in the metadata folder: dataset path in the output folder
+    products = {
+        'Aspect': r'Aspect\\aspect.tif',
+        'Buildings3D': r'Buildings\\Buildings.gdb\\Buildings3D',
+        'Contours5ft': r'Contours\\Contours.gdb\\Contours5ft',
+        'Contours10ft': r'Contours\\Contours.gdb\\Contours10ft',
+        'Contours20ft': r'Contours\\Contours.gdb\\Contours20ft',
+        'DEM': r'DEM\\dem.tif',
+        'DSM': r'DSM\\dsm.tif',
+        'HillshadeDEM': r'HillshadeDEM\\hillshadedem.tif',
+        'HillshadeDSM': r'HillshadeDSM\\hillshadedsm.tif',
+        'Intensity': r'Intensity\\intensity.tif',
+        'Mean': r'Mean\\mean.tif',
+        'Range': r'Range\\range.tif',
+        'Slope': r'Slope\\slope.tif',
+        'TerrainDEM': r'TerrainDEM\\TerrainDEM.gdb\\TDEM\\Terrain_DEM',
+        'TerrainDSM': r'TerrainDSM\\TerrainDSM.gdb\\TDSM\\Terrain_DSM',
+        # add tree canopy height/density datasets here
+    }
 
     timestamp = int(time.strftime('%Y', time.localtime()))
     (new_year, previous_year) = str(timestamp - 1), str(timestamp - 2)
 
-    os.chdir(meta)
+    xml_files = glob.glob(os.path.join(meta, '*.xml'))
 
-    for file in glob.glob('*.xml'):
-        with open(file, 'r') as xml:
-            text = xml.read().replace(previous_year, new_year)
-        with open(file, 'w+') as xml:
-            xml.write(text)
+    # file i/o bound; threads overlap the reads/writes
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_rewrite_year, xml_files, repeat(previous_year),
+            repeat(new_year)))
     
-    # add symbols from above to lookup below
-    ...
+    datasets = {rf'{output_folder}\\{path}': rf'{meta}\\{name}.xml'
+        for name, path in products.items()}
 
-    datasets = {aspect: aspect_meta, bdpatch: buildings_meta,
-        contours_five: contoursfive_meta, contours_ten: contoursten_meta,
-        contours_twenty: contourstwenty_meta, dem: dem_meta,
-        dsm: dsm_meta, hillshadedem: hillshadedem_meta,
-        hillshadedsm: hillshadedsm_meta, intensity: intensity_meta,
-        mean: mean_meta, range_r: range_meta, slope: slope_meta,
-        terraindem: terraindem_meta, terraindsm: terraindsm_meta}
+    groups = {}
 
+    # datasets sharing a geodatabase are edited by one process
     for key, value in datasets.items():
-        dataset = md.Metadata(key)
-        dataset.importMetadata(value, 'FGDC_CSDGM')
-        dataset.save()
+        workspace = key[:key.find('.gdb') + 4] if '.gdb' in key else key
+        groups.setdefault(workspace, []).append((key, value))
+
+    if workers > 1:
+        with process_pool(max_workers=workers) as executor:
+            list(executor.map(_import_metadata, groups.values()))
+    else:
+        for pairs in groups.values():
+            _import_metadata(pairs)
 
 ###############################################################################
 
@@ -347,13 +447,111 @@ def ranged(output_folder):
     model.
     """
 
+    dsm = (rf'{output_folder}\\DSM\\dsm.tif')
+    with extension('SPATIAL'):
+        ranged = arcpy.sa.FocalStatistics(dsm, '', 'RANGE')
+        ranged.save(rf'{output_folder}\\Range\\range.tif')
+
+###############################################################################
+
+def run_pipeline(output_folder, projection, base_contour, workers=4, skip=(),
+    compressed=False):
+    """Runs the lidar suite with independent products in parallel processes.
+    ---------------------------------------------------------------------------
+    PARAMETERS:
+    ---------------------------------------------------------------------------
+    projection: str
+        path to an ArcGIS projection file of the desired output coordinate
+        reference system
+    base_contour: int
+        base elevation contour value in feet passed to contours
+    workers: int
+        number of worker processes; each runs its own arcpy session
+    skip: iterable
+        function names to leave out (ex. 'buildings' when no footprints have
+        been digitized); skipped steps are treated as complete
+    compressed: bool
+        convert the .las files to .zlas first and read those in every later
+        step; ignored unless buildings is skipped, since ClassifyLasBuilding
+        writes class codes that .zlas files cannot store
+    ---------------------------------------------------------------------------
+    USAGE:
+    ---------------------------------------------------------------------------
     import arcpy
+    from pyxidust import lidar
+    arcpy.env.cellSize = 0.55
+    # worker processes require the calling script to guard its entry point
+    if __name__ == '__main__':
+        lidar.run_pipeline(output_folder=r'\\', projection=r'\\.prj',
+            base_contour=0, skip={'buildings'})
+    """
 
-    dsm = (rf'{output_folder}\\DSM\\dsm.tif')
-    arcpy.CheckOutExtension('SPATIAL')
-    ranged = arcpy.sa.FocalStatistics(dsm, '', 'RANGE')
-    ranged.save(rf'{output_folder}\\Range\\range.tif')
-    arcpy.CheckInExtension('SPATIAL')
+    skip = set(skip)
+    # classification edits the point files, so they stay .las when it runs
+    compressed = compressed and 'buildings' in skip
+
+    # name: (function, arguments, prerequisites); ClassifyLasBuilding writes
+    # class codes into the .las files, so every later reader of the points
+    # waits for buildings just as in the sequential lidar script
+    tasks = {
+        'lasd': (lasd, (output_folder, projection, compressed),
+            ('zlas',) if compressed else ()),
+        'dem': (dem, (output_folder,), ('lasd',)),
+        'buildings': (buildings, (output_folder,), ('dem',)),
+        'dsm': (dsm, (output_folder,), ('buildings',)),
+        'intensity': (intensity, (output_folder,), ('buildings',)),
+        'dem_terrain': (dem_terrain, (output_folder, projection, compressed),
+            ('buildings',)),
+        'dsm_terrain': (dsm_terrain, (output_folder, projection, compressed),
+            ('buildings',)),
+        'aspect': (aspect, (output_folder,), ('dem',)),
+        'dem_shade': (dem_shade, (output_folder,), ('dem',)),
+        'mean': (mean, (output_folder,), ('dem',)),
+        'contours': (contours, (output_folder, base_contour), ('mean',)),
+        'slope': (slope, (output_folder,), ('mean',)),
+        'dsm_shade': (dsm_shade, (output_folder,), ('dsm',)),
+        'ranged': (ranged, (output_folder,), ('dsm',)),
+    }
+
+    if compressed:
+        tasks['zlas'] = (zlas, (output_folder,), ())
+
+    done = set(skip)
+    pending = {key: value for key, value in tasks.items() if key not in done}
+    running = {}
+    settings = {name: getattr(arcpy.env, name) for name in _WORKER_ENV}
+
+    # split the cores between workers unless the caller chose a factor
+    if not settings['parallelProcessingFactor']:
+        settings['parallelProcessingFactor'] = f'{max(1, 100 // workers)}%'
+
+    # internally tiled, LZW-compressed .tif output unless the caller moved
+    # compression/tileSize off the arcpy defaults
+    for name, default, value in (('compression', 'LZ77', 'LZW'),
+        ('tileSize', '128 128', '256 256')):
+        if settings[name] in (None, '', default):
+            settings[name] = value
+
+    with process_pool(max_workers=workers, initializer=_init_worker,
+        initargs=(settings,)) as executor:
+        while pending or running:
+            # submit every step whose prerequisites have finished
+            ready = [key for key, (_, _, needs) in pending.items()
+                if done.issuperset(needs)]
+            for key in ready:
+                function, args, _ = pending.pop(key)
+                running[executor.submit(function, *args)] = key
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                key = running.pop(future)
+                # re-raises any error from the worker
+                future.result()
+                done.add(key)
+                print(f'{key} has executed')
+
+    # metadata edits every product; runs once all of them exist
+    if 'metadata' not in done:
+        metadata(output_folder, workers=workers)
 
 ###############################################################################
 
@@ -361,13 +559,10 @@ def slope(output_folder):
     """Creates a high-resolution slope raster from a digital elevation model.
     """
 
-    import arcpy
-
     mean = (rf'{output_folder}\\Mean\\mean.tif')
-    arcpy.CheckOutExtension('SPATIAL')
-    slope = arcpy.sa.SurfaceParameters(mean, 'SLOPE')
-    slope.save(rf'{output_folder}\\Slope\\slope.tif')
-    arcpy.CheckInExtension('SPATIAL')
+    with extension('SPATIAL'):
+        slope = arcpy.sa.SurfaceParameters(mean, 'SLOPE')
+        slope.save(rf'{output_folder}\\Slope\\slope.tif')
 
 ###############################################################################
 
@@ -381,67 +576,58 @@ def tree_canopy(output_folder, projection):
         path to a ArcGIS projection file used in the LAS To Multipoint tool
     """
 
-    import arcpy
-    from arcpy.conversion import LasDatasetToRaster
-    from arcpy.management import CreateLasDataset, LasPointStatsAsRaster
-    from arcpy.management import MakeLasDatasetLayer
-    from arcpy.sa import Con, Divide, Float, IsNull, Minus, Plus
-
     canopy = rf'{output_folder}\\Canopy'
     # input leaf-on .las files
     leaf_on = rf'{canopy}\\LAS'
 
     dem = rf'{canopy}\\DEM\\dem.tif'
-    dem_con = rf'{canopy}\\DEMCon\\demcon.tif'
-    dem_null = rf'{canopy}\\DEMNull\\demnull.tif'
     dem_stats = rf'{canopy}\\DEMStats\\demstats.tif'
     density = rf'{canopy}\\Density\\density.tif'
     dsm = rf'{canopy}\\DSM\\dsm.tif'
-    dsm_con = rf'{canopy}\\DSMCon\\dsmcon.tif'
-    dsm_null = rf'{canopy}\\DSMNull\\dsmnull.tif'
     dsm_stats = rf'{canopy}\\DSMStats\\dsmstats.tif'
-    float_ = rf'{canopy}\\Float\\float.tif'
     height = rf'{canopy}\\Height\\height.tif'
     lasd = rf'{canopy}\\LASD\\Working.lasd'
-    plus = rf'{canopy}\\Plus\\plus.tif'
-
-    arcpy.CheckOutExtension("SPATIAL")
-
-    # base data
-    CreateLasDataset(leaf_on, lasd, "NO_RECURSION", "", projection,
-        "COMPUTE_STATS", "ABSOLUTE_PATHS", "NO_FILES")
-
-    # dem workflow
-    MakeLasDatasetLayer(lasd, "TODEM", class_code=2)
-    LasDatasetToRaster("TODEM", dem, "ELEVATION",
-        "TRIANGULATION NATURAL_NEIGHBOR WINDOW_SIZE MAXIMUM 0", "FLOAT",
-        "OBSERVATIONS", 50000)
-    LasPointStatsAsRaster("TODEM", dem_stats, "POINT_COUNT", "CELLSIZE", 5.25)
-    dem_null_raster = IsNull(dem_stats)
-    dem_null_raster.save(dem_null)
-    dem_con_raster = Con(dem_null, 0, dem_stats)
-    dem_con_raster.save(dem_con)
-
-    # dsm workflow
-    MakeLasDatasetLayer(lasd, "TODSM", 1)
-    LasDatasetToRaster("TODSM", dsm, "ELEVATION",
-        "BINNING MAXIMUM NATURAL_NEIGHBOR", "FLOAT", "OBSERVATIONS", 50000)
-    LasPointStatsAsRaster("TODSM", dsm_stats, "POINT_COUNT", "CELLSIZE", 5.25)
-    dsm_null_raster = IsNull(dsm_stats)
-    dsm_null_raster.save(dsm_null)
-    dsm_con_raster = Con(dsm_null, 0, dsm_stats)
-    dsm_con_raster.save(dsm_con)
-
-    # math operations
-    plus_raster - Plus(dsm_con, dem_con)
-    plus_raster.save(plus)
-    plus_float_raster = Float(plus)
-    plus_float_raster.save(float_)
-    divide_raster = Divide(dsm_con, float_)
-    divide_raster.save(density)
-
-    # get canopy height
-    height_raster = Minus(dsm, dem)
-    height_raster.save(height)
-
-    arcpy.CheckInExtension("SPATIAL")
+
+    with extension('SPATIAL'):
+        # base data
+        CreateLasDataset(leaf_on, lasd, "NO_RECURSION", "", projection,
+            "COMPUTE_STATS", "ABSOLUTE_PATHS", "NO_FILES")
+
+        # dem workflow
+        ground = _las_layer(lasd, class_code=2)
+        LasDatasetToRaster(ground, dem, "ELEVATION",
+            "TRIANGULATION NATURAL_NEIGHBOR WINDOW_SIZE MAXIMUM 0", "FLOAT",
+            "OBSERVATIONS", 50000)
+        LasPointStatsAsRaster(ground, dem_stats, "POINT_COUNT",
+            "CELLSIZE", 5.25)
+
+        # dsm workflow
+        first = _las_layer(lasd, class_code=1)
+        LasDatasetToRaster(first, dsm, "ELEVATION",
+            "BINNING MAXIMUM NATURAL_NEIGHBOR", "FLOAT", "OBSERVATIONS", 50000)
+        LasPointStatsAsRaster(first, dsm_stats, "POINT_COUNT",
+            "CELLSIZE", 5.25)
+
+        # density as one map algebra expression; only the result is written
+        dsm_points = Con(IsNull(dsm_stats), 0, dsm_stats)
+        dem_points = Con(IsNull(dem_stats), 0, dem_stats)
+        density_raster = Float(dsm_points) / Float(dsm_points + dem_points)
+        density_raster.save(density)
+
+        # get canopy height
+        height_raster = Minus(dsm, dem)
+        height_raster.save(height)
+
+###############################################################################
+
+def zlas(output_folder):
+    """Compresses raw .las files to .zlas for faster lidar processing; pass
+    compressed=True to lasd/the terrains afterwards to read the smaller files.
+    Run only on unclassified data or after classification is finished.
+    """
+
+    las = (rf'{output_folder}\\LAS')
+    zlas = (rf'{output_folder}\\zLAS')
+    os.makedirs(zlas, exist_ok=True)
+    arcpy.conversion.ConvertLas(in_las=las, target_folder=zlas,
+        compression='ZLAS')
@@ -3,6 +3,70 @@
 """Project management/documentation and user coordination tools."""
 ###############################################################################
 
+import datetime
+import functools
+import getpass
+import locale
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from string import punctuation
+from tkinter import messagebox, Tk
+
+from pyxidust.config import ARCHIVE, CATALOG, DEFAULT_FILES
+from pyxidust.config import DEFAULT_FOLDERS, PROJECT, PROJECTS, SERIALS
+from pyxidust.config import SIZES, TEMPLATES, YEAR
+from pyxidust.utils import process_pool
+
+# arcpy is imported by the functions that use it, so the serial/validation
+# helpers also load outside an ArcGIS PRO environment
+
+# serial numbers as 'YYYYRRRR' or 'YYYYRRRR-CCCC'; .aprx as '{serial}_{title}'
+_APRX = re.compile(r'(\d{8}(?:-\d{4})?)_(.+)\.aprx')
+_SERIAL = re.compile(r'(\d{8})(?:-(\d{4}))?', re.ASCII)
+
+# special characters rejected in user input
+_SPECIAL = frozenset(punctuation)
+
+###############################################################################
+
+@functools.lru_cache(maxsize=None)
+def _root():
+    """Returns one hidden Tk root window shared by all message windows."""
+
+    root = Tk()
+    root.withdraw()
+
+    return root
+
+###############################################################################
+
+def _serial_key(name):
+    """Returns a sortable (base, counter) pair for a serial number or a name
+    starting with one; a missing counter sorts before '-0001'."""
+
+    base, suffix = _SERIAL.match(name).groups()
+
+    return int(base), int(suffix or 0)
+
+###############################################################################
+
+def _walk_files(root):
+    """Yields a directory entry per file below root; entries carry the file
+    type/stat info from the directory read so no extra syscalls are made."""
+
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+###############################################################################
+
 def add_map(directory, option, quantity, filename=None, template=None):
     """Creates new .aprx files in an existing project directory via incremental
     serial numbers. Each new .aprx file contains a new map/layout which serve
@@ -42,47 +106,62 @@ def add_map(directory, option, quantity, filename=None, template=None):
         quantity=99, filename='20240001-0005_GPSPoints.aprx')
     """
 
-    import os
-    import shutil
     import arcpy
-    from pyxidust.config import PROJECT
 
-    # get last-used/cloned serial number/title
-    aprx = (([i for i in os.listdir(directory) if i.endswith('.aprx')]).pop())
-    serial_base, title = aprx.replace('.aprx', '').split('_')
+    # get last-used/cloned serial number/title; the highest serial wins since
+    # directory listings are not guaranteed to be sorted and plain string
+    # order puts '20240001_' after '20240001-0007_'
+    with os.scandir(directory) as entries:
+        names = [i.name for i in entries if i.is_file() and
+            _APRX.fullmatch(i.name)]
+    if not names:
+        raise FileNotFoundError(
+            f'No serial-numbered .aprx file in {directory}')
+    aprx = max(names, key=_serial_key)
+    serial_base, title = _APRX.fullmatch(aprx).groups()
 
     if option == 'clone':
-        key, title = filename.replace('.aprx', '').split('_')
-
-    def _create_project():
-        """Creates/configures a new project per each iteration."""
-
-        path = os.path.join(directory, filename)
-        source = path if option == 'clone' else rf'{PROJECT}\\{template}.aprx'
-        destination = rf'{directory}\\{serial}_{title}.aprx'
-        shutil.copy(source, destination)
+        key, title = _APRX.fullmatch(filename).groups()
+        source = os.path.join(directory, filename)
+        # cloned maps/layouts are named after the source project
+        map_name = layout_name = f'{key}_{title}'
+        old_name = key
+
+    if option == 'scratch':
+        source = rf'{PROJECT}\\{template}.aprx'
+        map_name, layout_name, old_name = 'Map', 'Layout', 'SERIAL'
+
+    # serial numbers for every new project; the base is parsed/validated once
+    # and the counter is incremented as an integer
+    base, suffix = _SERIAL.fullmatch(new_serial(serial_base)).groups()
+    counter = int(suffix)
+    serials = []
+    for _ in range(0, quantity):
+        if counter > 9999:
+            base, counter = get_serial(), 1
+        serials.append(f'{base}-{counter:04d}')
+        counter += 1
+
+    # file copies release the GIL; finish them all before any arcpy work
+    destinations = [rf'{directory}\\{i}_{title}.aprx' for i in serials]
+    # never overwrite an existing project
+    existing = [i for i in destinations if os.path.exists(i)]
+    if existing:
+        raise FileExistsError(f'Projects already exist: {existing}')
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(shutil.copy, repeat(source), destinations))
+
+    # configure each copy with one open/save
+    for serial, destination in zip(serials, destinations):
         project = arcpy.mp.ArcGISProject(destination)
-
-        if option == 'clone':
-            clone = f'{key}_{title}'
-            map_, layout = change_element_name(project=project, map_name=clone,
-                layout_name=clone, element='TEXT_ELEMENT', old_name=key,
-                new_name=serial)
-
-        if option == 'scratch':
-            map_, layout = change_element_name(project=project, map_name='Map',
-                layout_name='Layout', element='TEXT_ELEMENT',
-                old_name='SERIAL', new_name=serial)
-
+        map_ = project.listMaps(map_name)[0]
+        layout = project.listLayouts(layout_name)[0]
+        for item in layout.listElements('TEXT_ELEMENT', old_name):
+            item.text = serial
         map_.name = f'{serial}_{title}'
         layout.name = f'{serial}_{title}'
-
         project.save()
-
-    serial = new_serial(serial_base)
-    for _ in range(0, quantity):
-        _create_project()
-        serial = new_serial(serial)
+        del project
 
 ###############################################################################
 
@@ -91,18 +170,17 @@ def archive_project():
     the new project decorator.
     """
 
-    import os
-    import shutil
-    from pyxidust.config import ARCHIVE, PROJECTS, YEAR
-
-    for root, folders, files in os.walk(PROJECTS):
-        for folder in folders:
-            if folder.startswith(YEAR):
+    # project folders only live at the top level of PROJECTS
+    with os.scandir(PROJECTS) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name.startswith(str(YEAR)):
                 pass
             else:
-                print(f'Moving folder to archive:\n{folder}\n')
-                shutil.copytree(folder, ARCHIVE)
-                shutil.rmtree(folder, ignore_errors=False)
+                print(f'Moving folder to archive:\n{entry.name}\n')
+                # rename on the same drive instead of copy/delete
+                shutil.move(entry.path, os.path.join(ARCHIVE, entry.name))
 
 ###############################################################################
 
@@ -143,8 +221,6 @@ def change_element_name(project, map_name, layout_name, element, old_name,
         element='TEXT_ELEMENT', old_name='Draft', new_name='Revised Draft')
     """
 
-    import arcpy
-
     map_ = project.listMaps(map_name)[0]
     layout = project.listLayouts(layout_name)[0]
     for item in layout.listElements(element, old_name):
@@ -161,10 +237,6 @@ def create_folder(folder_name, map_name, template):
     Called by the new project decorator.
     """
 
-    import os
-    import shutil
-    from pyxidust.config import PROJECTS, TEMPLATES
-
     directory = (f'{PROJECTS}\\{folder_name}')
     source = (f'{TEMPLATES}\\{template}.aprx')
     destination = (f'{directory}\\{map_name}')
@@ -175,7 +247,29 @@ def create_folder(folder_name, map_name, template):
 
 ###############################################################################
 
-def create_index(directory):
+def _scan_project(identifier, path):
+    """Returns ID/name pairs for the maps/layers/layouts in one .aprx file.
+    Called by create_index directly or in a worker process."""
+
+    import arcpy
+
+    map_frames = []
+    map_layers = []
+    map_layouts = []
+
+    project = arcpy.mp.ArcGISProject(path)
+    for map_ in project.listMaps():
+        map_frames.append((identifier, map_.name))
+        for layer in map_.listLayers():
+            map_layers.append((identifier, layer.name))
+    for layout in project.listLayouts():
+        map_layouts.append((identifier, layout.name))
+
+    return map_frames, map_layers, map_layouts
+
+###############################################################################
+
+def create_index(directory, workers=1):
     """Joins file metadata (name/path/modified) with layer/layout/map names via
     a global ID for each .aprx file in the specified directory.
     ---------------------------------------------------------------------------
@@ -183,73 +277,63 @@ def create_index(directory):
     ---------------------------------------------------------------------------
     directory: str
         path to a root project folder
+    workers: int
+        number of processes used to open .aprx files; values above 1 require
+        the calling script to guard its entry point with
+        if __name__ == '__main__'
     ---------------------------------------------------------------------------
     USAGE:
     ---------------------------------------------------------------------------
     from pyxidust.projects import create_index
     create_index(directory=r'\\')
+    # open projects in parallel worker processes
+    if __name__ == '__main__':
+        create_index(directory=r'\\', workers=4)
     """
 
-    import arcpy
-    import pandas
-    from pandas import merge, read_csv
+    from pandas import DataFrame
 
     map_frames = []
     map_layers = []
     map_layouts = []
 
-    # get/read metadata/create projects
-    get_metadata('.aprx', directory)
-    df = read_csv(filepath_or_buffer=rf'{directory}\\Catalog.csv')
-    projects = [arcpy.mp.ArcGISProject(i) for i in df['FILE_PATH']]
-
-    # use ID/project object to get/write ID/attributes to list
-    for identifier, project in enumerate(projects, start=1):
-        for map_ in project.listMaps():
-            map_frames.append(f'{str(identifier)}|{map_.name}')
-            for layer in map_.listLayers():
-                map_layers.append(f'{str(identifier)}|{layer.name}')
-        for layout in project.listLayouts():
-            map_layouts.append(f'{str(identifier)}|{layout.name}')
-
-    # write field names/attributes to newlines
-    with open(rf'{directory}\\Maps.csv', 'w+') as file:
-        map_index = '\n'.join(map_frames)
-        file.write(f'ID|MAP_NAME\n{map_index}')
-
-    with open(rf'{directory}\\Layers.csv', 'w+') as file:
-        layer_index = '\n'.join(map_layers)
-        file.write(f'ID|LAYER_NAME\n{layer_index}')
-
-    with open(rf'{directory}\\Layouts.csv', 'w+') as file:
-        layout_index = '\n'.join(map_layouts)
-        file.write(f'ID|LAYOUT_NAME\n{layout_index}')
-
-    # read-in structured newlines to perform merge assigning the global
-    # ID to the index values of the dataframes
-    df_info = read_csv(filepath_or_buffer=rf'{directory}\\Catalog.csv',
-        sep=',', index_col='ID')
-    df_layers = read_csv(filepath_or_buffer=rf'{directory}\\Layers.csv',
-        sep='|', index_col='ID')
-    df_layouts = read_csv(filepath_or_buffer=rf'{directory}\\Layouts.csv',
-        sep='|', index_col='ID')
-    df_maps = read_csv(filepath_or_buffer=rf'{directory}\\Maps.csv',
-        sep='|', index_col='ID')
+    # get metadata
+    df_info = get_metadata('.aprx', directory)
+
+    # projects are independent; workers return ID/attributes per project
+    if workers > 1:
+        with process_pool(max_workers=workers) as executor:
+            results = list(executor.map(_scan_project, df_info.index,
+                df_info['FILE_PATH']))
+    else:
+        results = [_scan_project(identifier, path) for identifier, path in
+            zip(df_info.index, df_info['FILE_PATH'])]
+
+    for frames, layers, layouts in results:
+        map_frames.extend(frames)
+        map_layers.extend(layers)
+        map_layouts.extend(layouts)
+
+    # build frames in memory assigning the global ID to the index values
+    df_layers = DataFrame(data=map_layers, columns=['ID', 'LAYER_NAME'])
+    df_layers = df_layers.set_index('ID')
+    df_layouts = DataFrame(data=map_layouts, columns=['ID', 'LAYOUT_NAME'])
+    df_layouts = df_layouts.set_index('ID')
+    df_maps = DataFrame(data=map_frames, columns=['ID', 'MAP_NAME'])
+    df_maps = df_maps.set_index('ID')
 
     # join file metadata to ArcGIS attributes and write to csv; output files
     # can be imported as separate sheets into an Excel notebook to create a
     # finished product; Excel does not support the number of rows created when
     # joining as one table with many-to-many relationships
-    layers_merge = merge(left=df_layers, right=df_info, how='left', on=None,
-        left_on='ID', right_on='ID')
-    layers_merge.to_csv(path_or_buf=rf'{directory}\\LayersJoined.csv', sep='|')
-    layouts_merge = merge(left=df_layouts, right=df_info, how='left', on=None,
-        left_on='ID', right_on='ID')
-    layouts_merge.to_csv(path_or_buf=rf'{directory}\\LayoutsJoined.csv',
+    # frames share the ID index; join aligns on it without rebuilding keys
+    layers_join = df_layers.join(other=df_info, how='left')
+    layers_join.to_csv(path_or_buf=rf'{directory}\\LayersJoined.csv', sep='|')
+    layouts_join = df_layouts.join(other=df_info, how='left')
+    layouts_join.to_csv(path_or_buf=rf'{directory}\\LayoutsJoined.csv',
         sep='|')
-    maps_merge = merge(left=df_maps, right=df_info, how='left', on=None,
-        left_on='ID', right_on='ID')
-    maps_merge.to_csv(path_or_buf=rf'{directory}\\MapsJoined.csv', sep='|')
+    maps_join = df_maps.join(other=df_info, how='left')
+    maps_join.to_csv(path_or_buf=rf'{directory}\\MapsJoined.csv', sep='|')
 
 ###############################################################################
 
@@ -268,19 +352,22 @@ def delete_project(directory):
     delete_project(directory=r'\\')
     """
 
-    import os
-    import shutil
-    from pyxidust.config import DEFAULT_FILES, DEFAULT_FOLDERS
+    def _match(name, items):
+        return any(name.startswith(i) or name.endswith(i) for i in items)
 
-    for root, folders, files in os.walk(directory):
-        for folder in folders:
-            for item in DEFAULT_FOLDERS:
-                if folder.startswith(item) or folder.endswith(item):
-                    shutil.rmtree(os.path.join(root, folder))
-        for file in files:
-            for item in DEFAULT_FILES:
-                if file.startswith(item) or file.endswith(item):
-                    os.remove(os.path.join(root, file))
+    def _clean(folder):
+        # removed folders are never descended into
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if _match(entry.name, DEFAULT_FOLDERS):
+                        shutil.rmtree(entry.path)
+                    else:
+                        _clean(entry.path)
+                elif _match(entry.name, DEFAULT_FILES):
+                    os.remove(entry.path)
+
+    _clean(directory)
 
 ###############################################################################
 
@@ -294,37 +381,40 @@ def get_metadata(extension, directory):
     directory: str
         path to a folder to search in
     ---------------------------------------------------------------------------
+    RETURNS:
+    ---------------------------------------------------------------------------
+    df:
+        pandas dataframe indexed by ID; also written to Catalog.csv
+    ---------------------------------------------------------------------------
     USAGE:
     ---------------------------------------------------------------------------
     from pyxidust.projects import get_metadata
     get_metadata(extension='.aprx', directory=r'\\')
     """
 
-    import datetime
-    import os
-    import pandas
-    from pandas import concat, DataFrame
+    from pandas import DataFrame, RangeIndex
 
     name = []
     path = []
     time = []
 
-    for root, folders, files in os.walk(directory):
-        for file in files:
-            if file.endswith(extension):
-                location = os.path.join(root, file)
-                path.append(location)
-                name.append(file)
-                unix_time = os.path.getmtime(location)
-                utc_time = datetime.datetime.utcfromtimestamp(unix_time)
-                time.append(utc_time)
-                df1 = DataFrame(data=name, columns=['FILE_NAME'])
-                df2 = DataFrame(data=path, columns=['FILE_PATH'])
-                df3 = DataFrame(data=time, columns=['LAST_MODIFIED'])
-                df4 = concat(objs=[df1, df2, df3], axis='columns')
-                df4.index += 1
-                df4.index.name = 'ID'
-                df5 = df4.to_csv(path_or_buf=rf'{directory}\\Catalog.csv')
+    for entry in _walk_files(directory):
+        if entry.name.endswith(extension):
+            path.append(entry.path)
+            name.append(entry.name)
+            unix_time = entry.stat().st_mtime
+            # naive UTC value; keeps the catalog format free of '+00:00'
+            utc_time = datetime.datetime.fromtimestamp(unix_time,
+                tz=datetime.timezone.utc).replace(tzinfo=None)
+            time.append(utc_time)
+
+    # build/write the catalog once after the crawl
+    df = DataFrame(data={'FILE_NAME': name, 'FILE_PATH': path,
+        'LAST_MODIFIED': time})
+    df.index = RangeIndex(start=1, stop=len(df) + 1, name='ID')
+    df.to_csv(path_or_buf=rf'{directory}\\Catalog.csv')
+
+    return df
 
 ###############################################################################
 
@@ -332,12 +422,15 @@ def get_serial():
     """Returns an incremented serial number from a file. Called by the new
     project decorator."""
 
-    from pyxidust.config import SERIALS, YEAR
+    # read/replace the counter through one handle; only the counter is
+    # stored so the year prefix is never read back as part of it
+    with open(SERIALS, 'r+') as file:
+        counter = int(file.read()) + 1
+        file.seek(0)
+        file.write(str(counter))
+        file.truncate()
 
-    with open(SERIALS, 'r') as file:
-        serial = (f'{YEAR}{str(int(file.read()) + 1)}')
-    with open(SERIALS, 'w+') as file:
-        file.write(serial)
+    serial = (f'{YEAR}{counter:04d}')
 
     return serial
 
@@ -368,14 +461,16 @@ def import_map(project, mxd, serial_number=None):
     import_map(project=project_, mxd=r'\\.mxd', serial_number='20201234-0001')
     """
 
-    import arcpy
-
     # choose serial number format
     if serial_number is None:
         serial_new = new_serial()
     else:
         serial_new = new_serial(serial_number)    
 
+    # invalid serial was already reported; leave the project untouched
+    if serial_new is None:
+        return
+
     # close open items/get existing maps/layouts
     project.closeViews()
     maps_old = project.listMaps()
@@ -408,18 +503,20 @@ def log_project(description, name, serial):
     """Writes project information to the catalog. Called by
     the new project decorator."""
 
-    import getpass
-    import time
-    from pyxidust.config import CATALOG
-
     map_serial = (f'{serial}-0001')
     folder_name = (f'{serial}_{name}')
     map_name = (f'{map_serial}_{name}.aprx')
     creator = getpass.getuser()
     stamp = time.strftime('%m/%d/%y,%H:%M:%S', time.localtime())
 
-    with open(CATALOG, 'a') as file:
-        file.write(f'\n{serial},{name},{description},{creator},{stamp}')
+    # one unbuffered append per entry; same leading-newline format and
+    # encoding the catalog has always been written with
+    entry = f'\n{serial},{name},{description},{creator},{stamp}'
+    descriptor = os.open(CATALOG, os.O_APPEND | os.O_CREAT | os.O_WRONLY)
+    try:
+        os.write(descriptor, entry.encode(locale.getpreferredencoding(False)))
+    finally:
+        os.close(descriptor)
 
     return folder_name, map_name, map_serial
 
@@ -441,7 +538,7 @@ def memory_swap(project):
     project_ = arcpy.mp.ArcGISProject(r'\\')
     project = memory_swap(project=project_)
     """
-    
+
     import arcpy
 
     project_path = project.filePath
@@ -454,8 +551,6 @@ def memory_swap(project):
 def message_window(option, title, message):
     """Wrapper for Tkinter error messages."""
 
-    from tkinter import messagebox, Tk
-
     options = {
         'askokcancel': messagebox.askokcancel,
         'askquestion': messagebox.askquestion,
@@ -466,13 +561,8 @@ def message_window(option, title, message):
         'showwarning': messagebox.showwarning
     }
 
-    for key, value in options.items():
-        if option == key:
-            error = value
-
-    root = Tk()
-    root.withdraw()
-    error(title, message)
+    _root()
+    options[option](title, message)
 
 ###############################################################################
 
@@ -486,11 +576,12 @@ def name_elements(directory, map_name, map_serial, name):
     map_ = project.listMaps('Map')[0]
     layout = project.listLayouts('Layout')[0]
 
+    # placeholder text:project value
+    substitutes = {'SERIAL_NUMBER': map_serial, 'TITLE': name}
     for element in layout.listElements('TEXT_ELEMENT', '*'):
-        if element.text == 'SERIAL_NUMBER':
-            element.text = map_serial
-        if element.text == 'TITLE':
-            element.text = name
+        text = substitutes.get(element.text)
+        if text is not None:
+            element.text = text
 
     if map_.name == 'Map':
         map_.name = map_serial
@@ -503,7 +594,6 @@ def name_elements(directory, map_name, map_serial, name):
 
 # @new_project
 def new_project(function):
-    import functools
     @functools.wraps(function)
     def wrapper(description, name, template, *args, **kwargs):
         """Creates a new ArcGIS PRO project and workspace. Relevant project
@@ -576,19 +666,20 @@ def new_serial(serial=None):
 
     # use existing serial number
     if serial is not None:
-        validate_serial(string=serial)
+        match = validate_serial(string=serial)
+        if match is None:
+            return None
+        base, suffix = match.groups()
         # increment base serial number
-        if len(serial) == 8:
-            serial_new = (f'{serial}-0001')
+        if suffix is None:
+            serial_new = (f'{base}-0001')
         # increment '-' serial number
-        elif len(serial) == 13:
-            base, suffix = serial.split('-')
+        else:
             suffix_int = (int(suffix)) + 1
-            suffix_new = str(suffix_int).zfill(4)
             if suffix_int > 9999:
                 serial_new = (f'{get_serial()}-0001')
             else:
-                serial_new = (f'{base}-{suffix_new}')
+                serial_new = (f'{base}-{suffix_int:04d}')
 
     return serial_new
 
@@ -618,8 +709,6 @@ def set_default(project, home, gdb, toolbox):
         toolbox=r'\\.tbx')
     """
     
-    import arcpy
-
     project.homeFolder = home
     project.defaultGeodatabase = gdb
     project.defaultToolbox = toolbox
@@ -632,32 +721,40 @@ def validate_project(description, name, template):
     """Performs data validation of user arguments. Called by
     the new project decorator."""
 
-    from sys import exit
-    from string import punctuation as SPECIAL
-    from pyxidust.config import SIZES
-
-    if any(i.isnumeric() for i in description):
-        error = 'Description does not accept numbers.'
-    elif any(i in SPECIAL for i in description):
-        error = 'Description does not accept special characters.'
-    elif len(description) > 50:
+    error = None
+
+    # one pass per string; the first offending character sets the error
+    for i in description:
+        if i.isnumeric():
+            error = 'Description does not accept numbers.'
+        elif i in _SPECIAL:
+            error = 'Description does not accept special characters.'
+        if error is not None:
+            break
+    if error is None and len(description) > 50:
         error = 'Description must be 50 characters or less.'
 
-    elif any(i.isspace() for i in name):
-        error = 'Name does not accept spaces.'
-    elif any(i in SPECIAL for i in name):
-        error = 'Name does not accept special characters.'
-    elif len(name) > 15:
+    if error is None:
+        for i in name:
+            if i.isspace():
+                error = 'Name does not accept spaces.'
+            elif i in _SPECIAL:
+                error = 'Name does not accept special characters.'
+            if error is not None:
+                break
+    if error is None and len(name) > 15:
         error = 'Name must be 15 characters or less.'
 
-    elif template not in SIZES:
+    if error is None and template not in SIZES:
         error = (f'Invalid template size for {template}')
 
+    # raise instead of exiting so a host session (e.g. the ArcGIS PRO python
+    # window) survives bad input
     if error is not None:
         message_window(option='showerror', title='ERROR:', message=error)
         restart = "'Check user input arguments and try again'"
         message_window(option='showerror', title='ERROR:', message=restart)
-        exit()
+        raise ValueError(error)
 
 ###############################################################################
 
@@ -671,33 +768,44 @@ def validate_serial(string):
         the four-digit year, 'RRRR' is the global ID, and 'CCCC' is a counter
         for multiple records belonging to the same project.
     ---------------------------------------------------------------------------
+    RETURNS:
+    ---------------------------------------------------------------------------
+    match:
+        regex match with base/counter groups, or None if the serial is invalid
+    ---------------------------------------------------------------------------
     USAGE:
     ---------------------------------------------------------------------------
     from pyxidust.utils import validate_serial
     validate_serial(string='20201234-0001')
     """
 
-    from string import punctuation as SPECIAL
-
     def _check_numeric(value):
         """Standard character validation."""
-        if any(i.isalpha() for i in value):
-            error_message = 'Serial number must not contain letters'
-            message_window('showinfo', 'ERROR:', error_message)
-        elif any(i.isspace() for i in value):
-            error_message = 'Serial number cannot have spaces'
-            message_window('showinfo', 'ERROR:', error_message)
-        elif any(i in SPECIAL for i in value):
-            error_message = 'Serial number cannot have special characters'
+        if value.isdigit():
+            return
+        # error path only; the first offending character picks the message
+        for i in value:
+            if i.isalpha():
+                error_message = 'Serial number must not contain letters'
+            elif i.isspace():
+                error_message = 'Serial number cannot have spaces'
+            elif i in _SPECIAL:
+                error_message = 'Serial number cannot have special characters'
+            else:
+                continue
             message_window('showinfo', 'ERROR:', error_message)
-        else:
-            pass
+            break
 
     def _format_error():
         """Error handling if user inputs serial # in wrong format."""
         error_message = 'Serial # format is 00000000 or 00000000-0000'
         message_window(option='showinfo', title='ERROR', message=error_message)
 
+    # valid serials skip the per-character checks
+    match = _SERIAL.fullmatch(string)
+    if match is not None:
+        return match
+
     # base serial
     if len(string) == 8:
         base = string
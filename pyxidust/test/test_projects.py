@@ -0,0 +1,145 @@
+# Pyxidust: geoprocessing/lidar/project tools for ESRI ArcGIS PRO software
+# Copyright (C) 2024  Gabriel Peck  pyxidust@pm.me
+"""Unit tests for the pure-Python helpers in the projects module."""
+###############################################################################
+
+import pytest
+
+from pyxidust import projects
+
+###############################################################################
+
+def test_serial_key_counter_is_numeric():
+    names = ['20240001-0009_GPS.aprx', '20240001-0010_GPS.aprx']
+    assert max(names, key=projects._serial_key) == '20240001-0010_GPS.aprx'
+
+def test_serial_key_base_sorts_before_counters():
+    # plain string order ranks '_' (0x5F) above '-' (0x2D)
+    names = ['20240001_GPS.aprx', '20240001-0007_GPS.aprx']
+    assert max(names, key=projects._serial_key) == '20240001-0007_GPS.aprx'
+
+def test_serial_key_base_before_counter():
+    names = ['20240002_GPS.aprx', '20240001-9999_GPS.aprx']
+    assert max(names, key=projects._serial_key) == '20240002_GPS.aprx'
+
+###############################################################################
+
+@pytest.fixture
+def messages(monkeypatch):
+    shown = []
+    monkeypatch.setattr(projects, 'message_window',
+        lambda option, title, message: shown.append(message))
+    return shown
+
+@pytest.mark.parametrize('serial, groups', [
+    ('20201234', ('20201234', None)),
+    ('20201234-0001', ('20201234', '0001')),
+])
+def test_validate_serial_valid(messages, serial, groups):
+    assert projects.validate_serial(string=serial).groups() == groups
+    assert messages == []
+
+@pytest.mark.parametrize('serial, message', [
+    ('2020123a', 'Serial number must not contain letters'),
+    ('2020 234', 'Serial number cannot have spaces'),
+    ('2020123!', 'Serial number cannot have special characters'),
+    ('20201234-00a1', 'Serial number must not contain letters'),
+    ('2020123', 'Serial # format is 00000000 or 00000000-0000'),
+    ('20201234_0001', 'Serial # format is 00000000 or 00000000-0000'),
+])
+def test_validate_serial_invalid(messages, serial, message):
+    assert projects.validate_serial(string=serial) is None
+    assert messages == [message]
+
+def test_new_serial_from_base(messages):
+    assert projects.new_serial(serial='20231234') == '20231234-0001'
+
+def test_new_serial_increments_counter(messages):
+    assert projects.new_serial(serial='20231234-0041') == '20231234-0042'
+
+def test_new_serial_rolls_over(messages, monkeypatch):
+    monkeypatch.setattr(projects, 'get_serial', lambda: '20240005')
+    assert projects.new_serial(serial='20231234-9999') == '20240005-0001'
+
+def test_new_serial_pulls_base(messages, monkeypatch):
+    monkeypatch.setattr(projects, 'get_serial', lambda: '20240005')
+    assert projects.new_serial() == '20240005-0001'
+
+def test_new_serial_invalid(messages):
+    assert projects.new_serial(serial='2023123a') is None
+
+def test_import_map_invalid_serial(messages):
+    class Project:
+        calls = []
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: self.calls.append(name)
+
+    project = Project()
+    projects.import_map(project=project, mxd='map.mxd',
+        serial_number='2023123a')
+    assert project.calls == []
+    assert messages == ['Serial number must not contain letters']
+
+###############################################################################
+
+@pytest.fixture
+def serials(tmp_path, monkeypatch):
+    path = tmp_path / 'serials.txt'
+    monkeypatch.setattr(projects, 'SERIALS', str(path))
+    monkeypatch.setattr(projects, 'YEAR', 2024)
+    return path
+
+def test_get_serial_pads_counter(serials):
+    serials.write_text('4')
+    assert projects.get_serial() == '20240005'
+
+def test_get_serial_stores_counter_only(serials):
+    serials.write_text('4')
+    projects.get_serial()
+    assert serials.read_text() == '5'
+
+def test_get_serial_consecutive_calls(serials):
+    serials.write_text('99')
+    assert [projects.get_serial() for _ in range(2)] == ['20240100',
+        '20240101']
+
+def test_get_serial_shorter_counter_truncates(serials):
+    # a shorter rewrite must not leave trailing digits from the old value
+    serials.write_text('0099')
+    projects.get_serial()
+    assert serials.read_text() == '100'
+
+###############################################################################
+
+def test_validate_project_valid(messages):
+    projects.validate_project(description='Survey of parcels',
+        name='GPSPoints', template='L_08x11')
+    assert messages == []
+
+@pytest.mark.parametrize('description, name, template, error', [
+    ('Phase 2', 'GPSPoints', 'L_08x11',
+        'Description does not accept numbers.'),
+    ('Parcels!', 'GPSPoints', 'L_08x11',
+        'Description does not accept special characters.'),
+    # the first offending character decides the message
+    ('Parcels! 2', 'GPSPoints', 'L_08x11',
+        'Description does not accept special characters.'),
+    ('A' * 51, 'GPSPoints', 'L_08x11',
+        'Description must be 50 characters or less.'),
+    # description errors are reported before name errors
+    ('Phase 2', 'GPS Points', 'L_08x11',
+        'Description does not accept numbers.'),
+    ('Parcels', 'GPS Points', 'L_08x11', 'Name does not accept spaces.'),
+    ('Parcels', 'GPS-Points', 'L_08x11',
+        'Name does not accept special characters.'),
+    ('Parcels', 'A' * 16, 'L_08x11', 'Name must be 15 characters or less.'),
+    # name errors are reported before template errors
+    ('Parcels', 'GPS Points', 'L_99x99', 'Name does not accept spaces.'),
+    ('Parcels', 'GPSPoints', 'L_99x99', 'Invalid template size for L_99x99'),
+])
+def test_validate_project_invalid(messages, description, name, template,
+    error):
+    with pytest.raises(ValueError, match=error.replace('.', r'\.')):
+        projects.validate_project(description=description, name=name,
+            template=template)
+    assert messages[0] == error
@@ -0,0 +1,67 @@
+# Pyxidust: geoprocessing/lidar/project tools for ESRI ArcGIS PRO software
+# Copyright (C) 2024  Gabriel Peck  pyxidust@pm.me
+"""Unit tests for the pure-Python helpers in the utils module."""
+###############################################################################
+
+import os
+from itertools import islice
+
+import pytest
+
+from pyxidust.utils import folder_signature, get_suffix, suffix_list
+
+###############################################################################
+
+@pytest.fixture
+def points(tmp_path):
+    for name in ('a.las', 'b.las'):
+        (tmp_path / name).write_bytes(b'points')
+    return tmp_path
+
+def test_signature_stable(points):
+    assert folder_signature(points, 'x.prj') == folder_signature(points,
+        'x.prj')
+
+def test_signature_arguments(points):
+    assert folder_signature(points, 'x.prj') != folder_signature(points,
+        'y.prj')
+
+def test_signature_new_file(points):
+    before = folder_signature(points)
+    (points / 'c.las').write_bytes(b'points')
+    assert folder_signature(points) != before
+
+def test_signature_size_change(points):
+    before = folder_signature(points)
+    (points / 'a.las').write_bytes(b'more points')
+    assert folder_signature(points) != before
+
+def test_signature_modified_time(points):
+    before = folder_signature(points)
+    stat = os.stat(points / 'a.las')
+    os.utime(points / 'a.las', ns=(stat.st_atime_ns,
+        stat.st_mtime_ns + 1_000_000_000))
+    assert folder_signature(points) != before
+
+###############################################################################
+
+def test_suffix_list_first_pass():
+    assert suffix_list(total=3) == ['A', 'B', 'C']
+
+def test_suffix_list_prefix():
+    assert suffix_list(total=2, string='input_') == ['input_A', 'input_B']
+
+def test_suffix_list_wraps_to_doubled_letters():
+    suffixes = suffix_list(total=28)
+    assert suffixes[25:] == ['Z', 'AA', 'BB']
+
+def test_suffix_list_matches_get_suffix():
+    expected = list(islice(get_suffix(string='cf_'), 60))
+    assert suffix_list(total=60, string='cf_') == expected
+
+def test_suffix_list_unique():
+    suffixes = suffix_list(total=100)
+    assert len(set(suffixes)) == 100
+
+def test_suffix_list_empty():
+    assert suffix_list(total=0) == []
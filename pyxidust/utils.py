@@ -0,0 +1,189 @@
+# Pyxidust: geoprocessing/lidar/project tools for ESRI ArcGIS PRO software
+# Copyright (C) 2024  Gabriel Peck  pyxidust@pm.me
+"""Shared helpers for licensing, worker processes and output naming; imports
+arcpy only where a helper needs it."""
+###############################################################################
+
+import functools
+import hashlib
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from string import ascii_uppercase as UPPER
+
+# extensions a worker process holds for its whole life
+HELD = set()
+
+###############################################################################
+
+@functools.lru_cache(maxsize=None)
+def _set_executable():
+    """Points spawned workers at python.exe; inside the PRO python window or a
+    script tool sys.executable is ArcGISPro.exe, which would start a new PRO
+    instance per worker. Runs once per process.
+    """
+
+    python = os.path.join(sys.exec_prefix, 'python.exe')
+
+    if os.path.isfile(python):
+        multiprocessing.set_executable(python)
+
+###############################################################################
+
+@contextmanager
+def extension(name):
+    """Checks out an ArcGIS extension for the block and always checks it back
+    in; a no-op when the process already holds the extension for its life.
+    ---------------------------------------------------------------------------
+    PARAMETERS:
+    ---------------------------------------------------------------------------
+    name: str
+        extension code (ex. 'SPATIAL', '3D')
+    ---------------------------------------------------------------------------
+    USAGE:
+    ---------------------------------------------------------------------------
+    from pyxidust.utils import extension
+    with extension('SPATIAL'):
+        slope = arcpy.sa.Slope(r'\\.tif')
+    """
+
+    import arcpy
+
+    if name in HELD:
+        yield
+        return
+
+    arcpy.CheckOutExtension(name)
+
+    try:
+        yield
+    finally:
+        arcpy.CheckInExtension(name)
+
+###############################################################################
+
+def folder_signature(folder, *args):
+    """Returns a hash of the file names/sizes/modified times in a folder plus
+    any extra arguments; used to skip rebuilding unchanged outputs.
+    ---------------------------------------------------------------------------
+    PARAMETERS:
+    ---------------------------------------------------------------------------
+    folder: str
+        path to the input folder
+    args:
+        extra values that also invalidate the output when they change
+    ---------------------------------------------------------------------------
+    RETURNS:
+    ---------------------------------------------------------------------------
+    signature: str
+        hex digest; equal only for unchanged folders and arguments
+    ---------------------------------------------------------------------------
+    USAGE:
+    ---------------------------------------------------------------------------
+    from pyxidust.utils import folder_signature
+    signature = folder_signature(r'\\', r'\\.prj')
+    """
+
+    digest = hashlib.sha1()
+
+    for entry in sorted(os.scandir(folder), key=lambda entry: entry.name):
+        stat = entry.stat()
+        digest.update(f'{entry.name}:{stat.st_size}:{stat.st_mtime_ns};'
+            .encode())
+
+    for arg in args:
+        digest.update(f'{arg};'.encode())
+
+    return digest.hexdigest()
+
+###############################################################################
+
+def get_suffix(string):
+    """Appends a unique letter combination to the string per each iteration.
+    ---------------------------------------------------------------------------
+    PARAMETERS:
+    ---------------------------------------------------------------------------
+    string: str
+        text value to be appended
+    ---------------------------------------------------------------------------
+    USAGE:
+    ---------------------------------------------------------------------------
+    from pyxidust.utils import get_suffix
+    # create generator to yield values
+    generator = get_suffix(string='filename_')
+    next(generator) -> 'filename_A'
+    next(generator) -> 'filename_B'
+    """
+
+    loops = 1
+
+    while loops > 0:
+        for letter in UPPER:
+            text = f'{string}{letter * loops}'
+            yield text
+            if letter.startswith('Z'):
+                loops += 1
+
+###############################################################################
+
+def process_pool(max_workers=None, **kwargs):
+    """Returns a ProcessPoolExecutor whose workers run python.exe instead of
+    the host application.
+    ---------------------------------------------------------------------------
+    PARAMETERS:
+    ---------------------------------------------------------------------------
+    max_workers: int
+        number of worker processes; defaults to the number of CPUs
+    kwargs:
+        passed through to ProcessPoolExecutor (ex. initializer, initargs)
+    ---------------------------------------------------------------------------
+    USAGE:
+    ---------------------------------------------------------------------------
+    from pyxidust.utils import process_pool
+    # worker processes require the calling script to guard its entry point
+    if __name__ == '__main__':
+        with process_pool(max_workers=4) as executor:
+            results = list(executor.map(function, items))
+    """
+
+    _set_executable()
+
+    return ProcessPoolExecutor(max_workers=max_workers, **kwargs)
+
+###############################################################################
+
+def suffix_list(total, string=''):
+    """Returns the first values yielded by get_suffix as a list.
+    ---------------------------------------------------------------------------
+    PARAMETERS:
+    ---------------------------------------------------------------------------
+    total: int
+        number of values to return
+    string: str
+        text value to be appended
+    ---------------------------------------------------------------------------
+    RETURNS:
+    ---------------------------------------------------------------------------
+    suffixes: list
+        unique letter combinations in get_suffix order
+    ---------------------------------------------------------------------------
+    USAGE:
+    ---------------------------------------------------------------------------
+    from pyxidust.utils import suffix_list
+    suffix_list(total=3, string='filename_') -> ['filename_A', 'filename_B',
+        'filename_C']
+    """
+
+    suffixes = []
+    loops = 1
+
+    # whole alphabet per pass; trimmed to size below
+    while len(suffixes) < total:
+        suffixes.extend(f'{string}{letter * loops}' for letter in UPPER)
+        loops += 1
+
+    return suffixes[:total]
+
+###############################################################################